@@ -13,7 +13,6 @@ from gaphor.diagram.propertypages import (
     PropertyPages,
     help_link,
     new_resource_builder,
-    unsubscribe_all_on_destroy,
 )
 from gaphor.UML.classes.datatype import DataTypeItem
 from gaphor.UML.classes.enumeration import EnumerationItem
@@ -49,17 +48,24 @@ class NamedElementPropertyPage(NamePropertyPage):
         super().__init__(subject)
 
     def construct(self):
-        if (
-            not self.subject
-            or UML.recipes.is_metaclass(self.subject)
-            or isinstance(
-                self.subject, (UML.ActivityPartition, UML.ActivityParameterNode)
-            )
-        ):
+        if not self._editable(self.subject):
             return
 
         return super().construct()
 
+    def rebind(self, page):
+        return self._editable(page.subject) and super().rebind(page)
+
+    @staticmethod
+    def _editable(subject):
+        return (
+            bool(subject)
+            and not UML.recipes.is_metaclass(subject)
+            and not isinstance(
+                subject, (UML.ActivityPartition, UML.ActivityParameterNode)
+            )
+        )
+
 
 @PropertyPages.register(UML.Classifier)
 class ClassifierPropertyPage(PropertyPageBase):
@@ -67,6 +73,7 @@ class ClassifierPropertyPage(PropertyPageBase):
 
     def __init__(self, subject):
         self.subject = subject
+        self.abstract: Gtk.Switch | None = None
 
     def construct(self):
         if UML.recipes.is_metaclass(self.subject):
@@ -77,10 +84,25 @@ class ClassifierPropertyPage(PropertyPageBase):
             signals={"abstract-changed": (self._on_abstract_change,)},
         )
 
-        abstract = builder.get_object("abstract")
-        abstract.set_active(self.subject.isAbstract)
+        self.abstract = builder.get_object("abstract")
+        self.abstract.set_active(self.subject.isAbstract)
+
+        classifier_editor = builder.get_object("classifier-editor")
+        classifier_editor.connect("notify::parent", self._on_parent_changed)
+        return classifier_editor
+
+    def rebind(self, page):
+        if not self.abstract or UML.recipes.is_metaclass(page.subject):
+            return False
 
-        return builder.get_object("classifier-editor")
+        self.subject = page.subject
+        self.abstract.set_active(self.subject.isAbstract)
+        return True
+
+    def _on_parent_changed(self, widget, _pspec):
+        # Release the subject: the page may be kept for reuse
+        if not widget.props.parent:
+            self.subject = None
 
     @transactional
     def _on_abstract_change(self, button, gparam):
@@ -211,6 +233,7 @@ class AttributesPage(PropertyPageBase):
         super().__init__()
         self.subject = subject
         self.watcher = subject and subject.watcher()
+        self.column_view: Gtk.ColumnView | None = None
 
     def construct(self):
         if type(self.subject) not in ATTRIBUTES_PAGE_CLASSIFIERS:
@@ -250,16 +273,42 @@ class AttributesPage(PropertyPageBase):
         ):
             column.set_factory(factory)
 
+        self.column_view = column_view
+        self._bind()
+
+        attributes_editor = builder.get_object("attributes-editor")
+        attributes_editor.connect("notify::parent", self._on_parent_changed)
+        return attributes_editor
+
+    def rebind(self, page):
+        if (
+            not self.column_view
+            or type(page.subject) not in ATTRIBUTES_PAGE_CLASSIFIERS
+        ):
+            return False
+
+        if self.watcher:
+            self.watcher.unsubscribe_all()
+        self.subject = page.subject
+        self.watcher = page.watcher
+        self._bind()
+        return True
+
+    def _bind(self):
+        assert self.column_view
         self.model = attribute_model(self.subject)
-        selection = Gtk.SingleSelection.new(self.model)
-        column_view.set_model(selection)
+        self.column_view.set_model(Gtk.SingleSelection.new(self.model))
 
         if self.watcher:
             self.watcher.watch("ownedAttribute", self.on_attributes_changed)
 
-        return unsubscribe_all_on_destroy(
-            builder.get_object("attributes-editor"), self.watcher
-        )
+    def _on_parent_changed(self, widget, _pspec):
+        # Release the subject: the page may be kept for reuse
+        if not widget.props.parent:
+            if self.watcher:
+                self.watcher.unsubscribe_all()
+            self.subject = None
+            self.watcher = None
 
     def on_attributes_changed(self, event):
         update_attribute_model(self.model, self.subject)
@@ -386,6 +435,7 @@ class OperationsPage(PropertyPageBase):
         super().__init__()
         self.subject = subject
         self.watcher = subject and subject.watcher()
+        self.column_view: Gtk.ColumnView | None = None
 
     def construct(self):
         if type(self.subject) not in OPERATIONS_PAGE_CLASSIFIERS:
@@ -432,16 +482,42 @@ class OperationsPage(PropertyPageBase):
         ):
             column.set_factory(factory)
 
+        self.column_view = column_view
+        self._bind()
+
+        operations_editor = builder.get_object("operations-editor")
+        operations_editor.connect("notify::parent", self._on_parent_changed)
+        return operations_editor
+
+    def rebind(self, page):
+        if (
+            not self.column_view
+            or type(page.subject) not in OPERATIONS_PAGE_CLASSIFIERS
+        ):
+            return False
+
+        if self.watcher:
+            self.watcher.unsubscribe_all()
+        self.subject = page.subject
+        self.watcher = page.watcher
+        self._bind()
+        return True
+
+    def _bind(self):
+        assert self.column_view
         self.model = operation_model(self.subject)
-        selection = Gtk.SingleSelection.new(self.model)
-        column_view.set_model(selection)
+        self.column_view.set_model(Gtk.SingleSelection.new(self.model))
 
         if self.watcher:
             self.watcher.watch("ownedOperation", self.on_operations_changed)
 
-        return unsubscribe_all_on_destroy(
-            builder.get_object("operations-editor"), self.watcher
-        )
+    def _on_parent_changed(self, widget, _pspec):
+        # Release the subject: the page may be kept for reuse
+        if not widget.props.parent:
+            if self.watcher:
+                self.watcher.unsubscribe_all()
+            self.subject = None
+            self.watcher = None
 
     def on_operations_changed(self, event):
         update_operation_model(self.model, self.subject)
@@ -1,7 +1,9 @@
 import logging
+from collections.abc import Callable, Iterable
 
 from gaphor import UML
 from gaphor.core.format import format
+from gaphor.core.modeling import Element
 from gaphor.core.modeling.properties import attribute
 from gaphor.diagram.presentation import (
     Classified,
@@ -26,6 +28,8 @@ class ClassItem(Classified, ElementPresentation[UML.Class]):
 
     def __init__(self, diagram, id=None):
         super().__init__(diagram, id=id)
+        self._attribute_rows: dict[UML.Property, CssNode] = {}
+        self._operation_rows: dict[UML.Operation, CssNode] = {}
 
         self.watch("show_stereotypes", self.update_shapes).watch(
             "show_attributes", self.update_shapes
@@ -57,13 +61,13 @@ class ClassItem(Classified, ElementPresentation[UML.Class]):
             *(
                 self.show_attributes
                 and self.subject
-                and [attributes_compartment(self.subject)]
+                and [attributes_compartment(self.subject, self._attribute_rows)]
                 or []
             ),
             *(
                 self.show_operations
                 and self.subject
-                and [operations_compartment(self.subject)]
+                and [operations_compartment(self.subject, self._operation_rows)]
                 or []
             ),
             *(self.show_stereotypes and stereotype_compartments(self.subject) or []),
@@ -105,51 +109,76 @@ def operation_watches(presentation, cast):
     )
 
 
-def attributes_compartment(subject):
-    # We need to scope the attribute value, since the for loop changes it.
-    def lazy_format(attribute):
-        return lambda: format(attribute)
+def compartment_rows(
+    elements: Iterable[Element],
+    create_row: Callable[[Element], CssNode],
+    rows: dict[Element, CssNode] | None = None,
+) -> list[CssNode]:
+    """Shapes for the rows of a compartment.
+
+    If ``rows`` is provided, rows of a previous call are reused and only
+    rows for new elements are created. ``rows`` is updated in place.
+    """
+    if rows is None:
+        return [create_row(element) for element in elements]
+
+    new_rows = {
+        element: rows.get(element) or create_row(element) for element in elements
+    }
+    rows.clear()
+    rows.update(new_rows)
+    return list(new_rows.values())
+
+
+def attributes_compartment(subject, rows=None):
+    def attribute_row(attribute):
+        return CssNode(
+            "attribute",
+            attribute,
+            Text(
+                text=lambda: format(attribute),
+            ),
+        )
 
     return CssNode(
         "compartment",
         subject,
         Box(
-            *(
-                CssNode(
-                    "attribute",
-                    attribute,
-                    Text(
-                        text=lazy_format(attribute),
-                    ),
-                )
-                for attribute in subject.ownedAttribute
-                if not attribute.association
+            *compartment_rows(
+                (
+                    attribute
+                    for attribute in subject.ownedAttribute
+                    if not attribute.association
+                ),
+                attribute_row,
+                rows,
             ),
             draw=draw_top_separator,
         ),
     )
 
 
-def operations_compartment(subject):
-    def lazy_format(operation):
-        return lambda: format(
-            operation, visibility=True, type=True, multiplicity=True, default=True
+def operations_compartment(subject, rows=None):
+    def operation_row(operation):
+        return CssNode(
+            "operation",
+            operation,
+            Text(
+                text=lambda: format(
+                    operation,
+                    visibility=True,
+                    type=True,
+                    multiplicity=True,
+                    default=True,
+                ),
+            ),
         )
 
     return CssNode(
         "compartment",
         subject,
         Box(
-            *(
-                CssNode(
-                    "operation",
-                    operation,
-                    Text(
-                        text=lazy_format(operation),
-                    ),
-                )
-                for operation in subject.ownedOperation
-            ),
+            *compartment_rows(subject.ownedOperation, operation_row, rows),
             draw=draw_top_separator,
         ),
     )
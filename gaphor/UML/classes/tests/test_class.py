@@ -97,3 +97,30 @@ def test_compartment_resizing(element_factory):
 
     width = klass.width
     assert width >= 170.0
+
+
+def test_attribute_rows_are_reused(element_factory):
+    diagram = element_factory.create(Diagram)
+    klass = diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+    attr1 = element_factory.create(UML.Property)
+    klass.subject.ownedAttribute = attr1
+    row1 = compartments(klass)[0].child.children[0]
+
+    attr2 = element_factory.create(UML.Property)
+    klass.subject.ownedAttribute = attr2
+
+    row1_again, row2 = compartments(klass)[0].child.children
+    assert row1_again is row1
+    assert row2.element is attr2
+
+
+def test_operation_rows_are_reused(element_factory):
+    diagram = element_factory.create(Diagram)
+    klass = diagram.create(ClassItem, subject=element_factory.create(UML.Class))
+    oper = element_factory.create(UML.Operation)
+    klass.subject.ownedOperation = oper
+    row = compartments(klass)[1].child.children[0]
+
+    oper.isStatic = True
+
+    assert compartments(klass)[1].child.children[0] is row
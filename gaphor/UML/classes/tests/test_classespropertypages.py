@@ -52,6 +52,31 @@ def test_classifier_property_page(element_factory):
     assert subject.isAbstract
 
 
+def test_classifier_property_page_rebind(element_factory):
+    subject = element_factory.create(UML.Class)
+    other = element_factory.create(UML.Class)
+    other.isAbstract = True
+    property_page = ClassifierPropertyPage(subject)
+    widget = property_page.construct()
+
+    assert property_page.rebind(ClassifierPropertyPage(other))
+
+    abstract = find(widget, "abstract")
+    assert abstract.get_active()
+
+    abstract.set_active(False)
+
+    assert not other.isAbstract
+    assert not subject.isAbstract
+
+
+def test_no_classifier_property_page_rebind_for_metaclass(element_factory, metaclass):
+    property_page = ClassifierPropertyPage(element_factory.create(UML.Class))
+    property_page.construct()
+
+    assert not property_page.rebind(ClassifierPropertyPage(metaclass))
+
+
 def test_no_classifier_property_page_for_metaclass(metaclass):
     property_page = ClassifierPropertyPage(metaclass)
     widget = property_page.construct()
@@ -97,6 +122,23 @@ def test_attributes_page_add_attribute(diagram, element_factory):
     assert subject.attribute[0].typeValue == "str"
 
 
+def test_attributes_page_rebind(element_factory):
+    subject = element_factory.create(UML.Class)
+    other = element_factory.create(UML.Class)
+    property_page = AttributesPage(subject)
+    property_page.construct()
+
+    assert property_page.rebind(AttributesPage(other))
+
+    property_page.model.get_item(0).attribute = "attr"
+    subject.ownedAttribute = element_factory.create(UML.Property)
+
+    assert other.ownedAttribute[0].name == "attr"
+    assert [view.attr for view in property_page.model if view.attr] == [
+        other.ownedAttribute[0]
+    ]
+
+
 def test_attribute_create_model(element_factory):
     subject = element_factory.create(UML.Class)
 
@@ -139,3 +181,20 @@ def test_operations_page_add_operation(element_factory):
     property_page.model.get_item(0).operation = "+ oper()"
 
     assert subject.ownedOperation[0].name == "oper"
+
+
+def test_operations_page_rebind(element_factory):
+    subject = element_factory.create(UML.Class)
+    other = element_factory.create(UML.Class)
+    property_page = OperationsPage(subject)
+    property_page.construct()
+
+    assert property_page.rebind(OperationsPage(other))
+
+    property_page.model.get_item(0).operation = "oper()"
+    subject.ownedOperation = element_factory.create(UML.Operation)
+
+    assert other.ownedOperation[0].name == "oper"
+    assert [view.oper for view in property_page.model if view.oper] == [
+        other.ownedOperation[0]
+    ]
@@ -197,10 +197,25 @@ class Session(Service):
     """A user context is a set of services (including UI services) that define
     a window with loaded model."""
 
-    def __init__(self, session_id: str | None = None, *, services=None):
-        """Initialize the application."""
+    HEADLESS_SERVICES = [
+        "event_manager",
+        "component_registry",
+        "element_factory",
+        "modeling_language",
+    ]
+
+    def __init__(
+        self, session_id: str | None = None, *, services=None, **known_services
+    ):
+        """Initialize the application.
+
+        ``services`` limits the services that are created. Service
+        instances can be provided as keyword arguments.
+        """
         self.session_id = session_id or str(uuid1())
-        services_by_name: dict[str, Service] = initialize("gaphor.services", services)
+        services_by_name: dict[str, Service] = initialize(
+            "gaphor.services", services, **known_services
+        )
         self._filename = None
 
         self.event_manager: EventManager = cast(
@@ -217,6 +232,18 @@ class Session(Service):
 
         self.event_manager.subscribe(self.on_filename_changed)
 
+    @classmethod
+    def headless(cls, session_id: str | None = None, **known_services) -> Session:
+        """Create a session for batch tools, such as export and code
+        generation.
+
+        Only the event manager, component registry, element factory and
+        modeling languages are created. There is no element dispatcher, so
+        element watchers are inert: models are loaded and read, not edited.
+        UI services, the sanitizer and the undo manager are left out.
+        """
+        return cls(session_id, services=cls.HEADLESS_SERVICES, **known_services)
+
     def get_service(self, name):
         if not self.component_registry:
             raise NotInitializedError("Session is no longer alive")
@@ -25,12 +25,15 @@ from __future__ import annotations
 import argparse
 import contextlib
 import logging
+import multiprocessing
 import sys
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, NamedTuple
 
 from gaphor import UML
+from gaphor.application import Session
 from gaphor.codegen.override import Overrides
 from gaphor.core.modeling import Element, ElementFactory
 from gaphor.core.modeling.modelinglanguage import (
@@ -95,7 +98,7 @@ def main(
     model = load_model(modelfile, modeling_language)
     super_models = (
         [
-            (load_modeling_language(lang), load_model(f, modeling_language))
+            super_model(load_modeling_language(lang), load_model(f, modeling_language))
             for lang, f in supermodelfiles
         ]
         if supermodelfiles
@@ -103,15 +106,109 @@ def main(
     )
     overrides = Overrides(overridesfile) if overridesfile else None
 
+    write(outfile, coder(model, super_models, overrides))
+
+
+class GeneratedModel(NamedTuple):
+    modelfile: str
+    overridesfile: str | None
+    outfile: str
+    supermodels: list[str]
+
+
+GENERATED_MODELS = {
+    "Core": GeneratedModel(
+        "models/Core.gaphor",
+        "models/Core.override",
+        "gaphor/core/modeling/coremodel.py",
+        [],
+    ),
+    "UML": GeneratedModel(
+        "models/UML.gaphor", "models/UML.override", "gaphor/UML/uml.py", ["Core"]
+    ),
+    "SysML": GeneratedModel(
+        "models/SysML.gaphor",
+        "models/SysML.override",
+        "gaphor/SysML/sysml.py",
+        ["Core", "UML"],
+    ),
+    "RAAML": GeneratedModel(
+        "models/RAAML.gaphor",
+        None,
+        "gaphor/RAAML/raaml.py",
+        ["Core", "UML", "SysML"],
+    ),
+    "C4Model": GeneratedModel(
+        "models/C4Model.gaphor", None, "gaphor/C4Model/c4model.py", ["UML"]
+    ),
+}
+
+# Models loaded by generate_all(), inherited by forked worker processes
+_loaded_models: dict[str, ElementFactory] = {}
+_super_models: dict[str, SuperModel] = {}
+
+
+def generate_all(jobs: int | None = None) -> None:
+    """Regenerate all data models.
+
+    Every model file is loaded once and shared as super-model. Models are
+    generated in parallel worker processes, if the platform can fork.
+    """
+    logging.basicConfig()
+
+    modeling_language = MockModelingLanguage(
+        CoreModelingLanguage(), UMLModelingLanguage(), SysMLModelingLanguage()
+    )
+    for name, generated_model in GENERATED_MODELS.items():
+        _loaded_models[name] = load_model(generated_model.modelfile, modeling_language)
+    for name in {s for g in GENERATED_MODELS.values() for s in g.supermodels}:
+        _super_models[name] = super_model(
+            load_modeling_language(name), _loaded_models[name]
+        )
+
+    try:
+        if jobs != 1 and "fork" in multiprocessing.get_all_start_methods():
+            with ProcessPoolExecutor(
+                jobs, mp_context=multiprocessing.get_context("fork")
+            ) as executor:
+                list(executor.map(_generate, GENERATED_MODELS))
+        else:
+            for name in GENERATED_MODELS:
+                _generate(name)
+    finally:
+        _loaded_models.clear()
+        _super_models.clear()
+
+
+def _generate(name: str) -> None:
+    generated_model = GENERATED_MODELS[name]
+    overrides = (
+        Overrides(generated_model.overridesfile)
+        if generated_model.overridesfile
+        else None
+    )
+    write(
+        generated_model.outfile,
+        coder(
+            _loaded_models[name],
+            [_super_models[s] for s in generated_model.supermodels],
+            overrides,
+        ),
+    )
+
+
+def write(outfile: str | Path | None, lines: Iterable[str]) -> None:
     with open(outfile, "w", encoding="utf-8") if outfile else contextlib.nullcontext(
         sys.stdout
     ) as out:  # type: ignore[attr-defined]
-        for line in coder(model, super_models, overrides):
+        for line in lines:
             print(line, file=out)
 
 
 def load_model(modelfile: str, modeling_language: ModelingLanguage) -> ElementFactory:
-    element_factory = ElementFactory()
+    element_factory = Session.headless(modeling_language=modeling_language).get_service(
+        "element_factory"
+    )
     with open(modelfile, encoding="utf-8") as file_obj:
         storage.load(
             file_obj,
@@ -128,9 +225,33 @@ def load_modeling_language(lang) -> ModelingLanguage:
     return initialize("gaphor.modelinglanguages", [lang])[lang]
 
 
+class SuperModel(NamedTuple):
+    """A model the generated model depends on, with its classes indexed by
+    name."""
+
+    modeling_language: ModelingLanguage
+    element_factory: ElementFactory
+    classes: dict[str, UML.Class]
+
+
+def super_model(
+    modeling_language: ModelingLanguage, element_factory: ElementFactory
+) -> SuperModel:
+    classes: dict[str, UML.Class] = {}
+    for cls in element_factory.select(UML.Class):
+        if (
+            cls.name
+            and cls.name not in classes
+            and not is_enumeration(cls)
+            and not (cls.owningPackage and is_in_profile(cls))
+        ):
+            classes[cls.name] = cls
+    return SuperModel(modeling_language, element_factory, classes)
+
+
 def coder(
     model: ElementFactory,
-    super_models: list[tuple[ModelingLanguage, ElementFactory]],
+    super_models: list[SuperModel],
     overrides: Overrides | None,
 ) -> Iterable[str]:
     classes = list(
@@ -261,7 +382,7 @@ def associations(
 
 def subsets(
     c: UML.Class,
-    super_models: list[tuple[ModelingLanguage, ElementFactory]],
+    super_models: list[SuperModel],
 ):
     for a in c.ownedAttribute:
         if (
@@ -415,7 +536,7 @@ def redefines(a: UML.Property) -> str | None:
 
 
 def attribute(
-    c: UML.Class, name: str, super_models: list[tuple[ModelingLanguage, ElementFactory]]
+    c: UML.Class, name: str, super_models: list[SuperModel]
 ) -> tuple[type[Element] | None, UML.Property | None]:
     a: UML.Property | None
     for a in c.ownedAttribute:
@@ -436,24 +557,24 @@ def attribute(
 
 
 def in_super_model(
-    name: str, super_models: list[tuple[ModelingLanguage, ElementFactory]]
+    name: str, super_models: list[SuperModel]
 ) -> tuple[type[Element], UML.Class] | tuple[None, None]:
-    for modeling_language, factory in super_models:
-        cls: UML.Class
-        for cls in factory.select(  # type: ignore[assignment]
-            lambda e: isinstance(e, UML.Class) and e.name == name
-        ):
-            if not (is_in_profile(cls) or is_enumeration(cls)):
-                element_type = modeling_language.lookup_element(cls.name)
-                assert (
-                    element_type
-                ), f"Type {cls.name} found in model, but not in generated model"
-                return element_type, cls
+    for modeling_language, _, classes in super_models:
+        if cls := classes.get(name):
+            element_type = modeling_language.lookup_element(cls.name)
+            assert (
+                element_type
+            ), f"Type {cls.name} found in model, but not in generated model"
+            return element_type, cls
     return None, None
 
 
 def resolve_attribute_type_values(element_factory: ElementFactory) -> None:
     """Some model updates that are hard to do from Gaphor itself."""
+    classes: dict[str, UML.Class] = {}
+    for cls in element_factory.select(UML.Class):
+        classes.setdefault(cls.name, cls)
+
     for prop in element_factory.select(UML.Property):
         if prop.typeValue in ("String", "str", "object"):
             prop.typeValue = "str"
@@ -465,12 +586,7 @@ def resolve_attribute_type_values(element_factory: ElementFactory) -> None:
             "UnlimitedNatural",
         ):
             prop.typeValue = "int"
-        elif c := next(
-            element_factory.select(
-                lambda e: isinstance(e, UML.Class) and e.name == prop.typeValue  # noqa: B023
-            ),
-            None,
-        ):
+        elif c := classes.get(prop.typeValue):
             prop.type = c  # type: ignore[assignment]
             del prop.typeValue
             prop.aggregation = "composite"
@@ -14,6 +14,7 @@ from gaphor.codegen.coder import (
     load_modeling_language,
     order_classes,
     resolve_attribute_type_values,
+    super_model,
     variables,
 )
 from gaphor.core.format import parse
@@ -266,7 +267,7 @@ def test_attribute_from_super_model(uml_metamodel: ElementFactory):
     class_.name = "Package"
 
     element_type, base = attribute(
-        class_, "relationship", [(UMLModelingLanguage(), uml_metamodel)]
+        class_, "relationship", [super_model(UMLModelingLanguage(), uml_metamodel)]
     )
 
     assert element_type is UML.Package
@@ -284,3 +285,10 @@ def test_replace_simple_attribute(uml_metamodel: ElementFactory):
     assert a.name == "specification"
     assert a.typeValue == "str"
     assert not a.type
+
+
+def test_super_model_index(uml_metamodel: ElementFactory):
+    model = super_model(UMLModelingLanguage(), uml_metamodel)
+
+    assert model.classes["Package"].name == "Package"
+    assert "AggregationKind" not in model.classes
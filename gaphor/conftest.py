@@ -6,6 +6,7 @@ services and start off.
 # ruff: noqa: I001
 from __future__ import annotations
 
+import time
 from io import StringIO
 from pathlib import Path
 
@@ -139,6 +140,26 @@ def view(diagram):
     return view
 
 
+@pytest.fixture
+def benchmark(record_property):
+    """Time a function.
+
+    The fastest of a number of rounds is recorded as test property,
+    so it ends up in the (JUnit) test report.
+    """
+
+    def run(func, *args, rounds=3, **kwargs):
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            timings.append(time.perf_counter() - start)
+        record_property("benchmark", min(timings))
+        return result
+
+    return run
+
+
 @pytest.fixture(autouse=True)
 def tmp_get_cache_config_dir(tmp_path, monkeypatch):
     monkeypatch.setattr(gaphor.settings, "get_config_dir", lambda: tmp_path)
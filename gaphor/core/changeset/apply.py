@@ -34,7 +34,10 @@ def _(change: ElementChange, element_factory, modeling_factory):
         diagram = (
             element_factory.lookup(change.diagram_id) if change.diagram_id else None
         )
-        element_factory.create_as(element_type, change.element_id, diagram=diagram)
+        if diagram:
+            diagram.create_as(element_type, change.element_id)
+        else:
+            element_factory.create_as(element_type, change.element_id)
     elif change.op == "remove":
         if element := element_factory.lookup(change.element_id):
             element.unlink()
@@ -132,6 +132,12 @@ class collection(Generic[T]):
         self.items.sort(key=key)
         self.object.handle(AssociationUpdated(self.object, self.property))
 
+    def move(self, value: T, index: int) -> None:
+        """Move an element to position ``index``."""
+        self.items.remove(value)
+        self.items.insert(index, value)
+        self.object.handle(AssociationUpdated(self.object, self.property))
+
 
 _recurseproxy_trigger = slice(None, None, None)
 
@@ -5,7 +5,10 @@ Diagrams can be visualized and edited.
 from __future__ import annotations
 
 import logging
+import time
+from bisect import bisect_left
 from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import (
@@ -31,6 +34,10 @@ from gaphor.core.modeling.event import (
     AssociationDeleted,
     DiagramUpdateRequested,
 )
+from gaphor.core.modeling.instrumentation import (
+    UpdateStats,
+    set_current_update_stats,
+)
 from gaphor.core.modeling.presentation import Presentation
 from gaphor.core.modeling.properties import (
     association,
@@ -281,6 +288,9 @@ class Diagram(Element):
         self._compiled_style_sheet: CompiledStyleSheet | None = None
         self._registered_views: set[gaphas.model.View] = set()
         self._dirty_items: set[gaphas.Item] = set()
+        self._presentations_by_id: dict[Id, Presentation] = {}
+        self._bulk_created: set[Presentation] | None = None
+        self._update_handlers: list[Callable[[Diagram, UpdateStats], None]] = []
 
         self._watcher = self.watcher()
         self._watcher.watch("ownedPresentation", self._owned_presentation_changed)
@@ -297,9 +307,25 @@ class Diagram(Element):
 
     def _owned_presentation_changed(self, event):
         if isinstance(event, AssociationDeleted) and event.old_value:
+            self._presentations_by_id.pop(event.old_value.id, None)
             self._update_dirty_items(removed_items={event.old_value})
         elif isinstance(event, AssociationAdded):
-            self._order_owned_presentation()
+            item = event.new_value
+            self._presentations_by_id[item.id] = item
+            if item.parent or item.children:
+                self._order_owned_presentation()
+            elif not isinstance(item, gaphas.Line):
+                # A new top-level item belongs before the lines;
+                # a new top-level line is appended last, where it belongs
+                ownedPresentation = self.ownedPresentation
+                index = bisect_left(
+                    ownedPresentation.items,
+                    True,
+                    hi=len(ownedPresentation) - 1,
+                    key=lambda e: isinstance(e, gaphas.Line),
+                )
+                if ownedPresentation[index] is not item:
+                    ownedPresentation.move(item, index)
 
     def _order_owned_presentation(self, event=None):
         if event and event.property is not Presentation.parent:
@@ -307,28 +333,28 @@ class Diagram(Element):
 
         ownedPresentation = self.ownedPresentation
 
+        children: dict[Presentation | None, list[Presentation]] = {}
+        for item in ownedPresentation:
+            children.setdefault(item.parent, []).append(item)
+
         def traverse_items(parent=None) -> Iterable[Presentation]:
-            for item in ownedPresentation:
-                if item.parent is parent:
-                    yield item
-                    yield from traverse_items(item)
+            for item in children.get(parent, ()):
+                yield item
+                yield from traverse_items(item)
 
         new_order = sorted(
             traverse_items(), key=lambda e: int(isinstance(e, gaphas.Line))
         )
-        self.ownedPresentation.order(new_order.index)
+        if ownedPresentation != new_order:
+            positions = {item: n for n, item in enumerate(new_order)}
+            ownedPresentation.order(positions.__getitem__)
 
     @property
     def styleSheet(self) -> StyleSheet | None:
         return next(self.model.select(StyleSheet), None)
 
     def style(self, node: StyleNode) -> Style:
-        if not (compiled_style_sheet := self._compiled_style_sheet):
-            style_sheet = self.styleSheet
-            compiled_style_sheet = self._compiled_style_sheet = (
-                style_sheet.new_compiled_style_sheet() if style_sheet else None
-            )
-
+        compiled_style_sheet = self._style_sheet()
         return (
             compiled_style_sheet.compute_style(node)
             if compiled_style_sheet
@@ -378,15 +404,52 @@ class Diagram(Element):
             item.subject = subject
         if parent:
             item.parent = parent
-        self.update({item})
+        self._presentations_by_id[item.id] = item
+        if self._bulk_created is None:
+            self.update({item})
+        else:
+            self._bulk_created.add(item)
         return item
 
+    @contextmanager
+    def bulk_create(self) -> Iterator[None]:
+        """Defer the update of new presentations.
+
+        Presentations created with :meth:`create` and :meth:`create_as`
+        are not updated one by one, but all at once when the context exits.
+        """
+        if self._bulk_created is not None:
+            yield
+            return
+
+        self._bulk_created = set()
+        try:
+            yield
+        finally:
+            created, self._bulk_created = self._bulk_created, None
+
+        if created := {item for item in created if item.diagram is self}:
+            self.update(created)
+
     def lookup(self, id: Id) -> Presentation | None:
         """Find a presentation item by id.
 
         Returns a presentation in this diagram or return ``None``.
         """
-        return next((item for item in self.get_all_items() if item.id == id), None)
+        presentations_by_id = self._presentations_by_id
+        item = presentations_by_id.get(id)
+        if item and item.diagram is self:
+            return item
+
+        # The index is out of sync if ownedPresentation changed while
+        # no events were dispatched, e.g. during model loading.
+        if item or len(presentations_by_id) != len(self.ownedPresentation):
+            presentations_by_id.clear()
+            presentations_by_id.update(
+                (item.id, item) for item in self.ownedPresentation
+            )
+            return presentations_by_id.get(id)
+        return None
 
     def unlink(self):
         """Unlink all canvas items then unlink this diagram."""
@@ -435,14 +498,79 @@ class Diagram(Element):
                 yield item
                 yield from gaphas.canvas.ancestors(self, item)
 
-        for item in reversed(list(self.sort(dirty_items_with_ancestors()))):
-            if update := getattr(item, "update", None):
-                update(UpdateContext(style=self.style(StyledItem(item))))
+        items = reversed(list(self.sort(dirty_items_with_ancestors())))
+
+        if self._update_handlers:
+            self._update_instrumented(items)
+        else:
+            for item in items:
+                if update := getattr(item, "update", None):
+                    update(UpdateContext(style=self.style(StyledItem(item))))
 
-        self._connections.solve()
+            self._connections.solve()
 
         self._dirty_items.clear()
 
+    def _style_sheet(self) -> CompiledStyleSheet | None:
+        if not (compiled_style_sheet := self._compiled_style_sheet):
+            style_sheet = self.styleSheet
+            compiled_style_sheet = self._compiled_style_sheet = (
+                style_sheet.new_compiled_style_sheet() if style_sheet else None
+            )
+        return compiled_style_sheet
+
+    def _update_instrumented(self, items: Iterable[Presentation]) -> None:
+        stats = UpdateStats(dirty_items=len(self._dirty_items))
+        # The style cache counters accumulate over the life of the style sheet
+        compiled_style_sheet = self._style_sheet()
+        style_cache = (
+            compiled_style_sheet.compute_style.cache_info()
+            if compiled_style_sheet
+            else None
+        )
+        previous_stats = set_current_update_stats(stats)
+        start = time.perf_counter()
+        try:
+            for item in items:
+                stats.updated_items += 1
+                if update := getattr(item, "update", None):
+                    item_start = time.perf_counter()
+                    update(UpdateContext(style=self.style(StyledItem(item))))
+                    stats.time_per_class[type(item)] += time.perf_counter() - item_start
+
+            solver_start = time.perf_counter()
+            self._connections.solve()
+            stats.solver_time = time.perf_counter() - solver_start
+        finally:
+            set_current_update_stats(previous_stats)
+
+        stats.total_time = time.perf_counter() - start
+        if style_cache and self._compiled_style_sheet is compiled_style_sheet:
+            cache_info = compiled_style_sheet.compute_style.cache_info()
+            stats.style_computations = cache_info.misses - style_cache.misses
+            stats.style_cache_hits = cache_info.hits - style_cache.hits
+
+        for handler in self._update_handlers:
+            handler(self, stats)
+
+    def add_update_handler(
+        self, handler: Callable[[Diagram, UpdateStats], None]
+    ) -> None:
+        """Instrument updates of this diagram.
+
+        After every update, ``handler`` is called with the diagram and
+        the :class:`~gaphor.core.modeling.instrumentation.UpdateStats`
+        of that update. Adding a handler twice has no effect.
+        """
+        if handler not in self._update_handlers:
+            self._update_handlers.append(handler)
+
+    def remove_update_handler(
+        self, handler: Callable[[Diagram, UpdateStats], None]
+    ) -> None:
+        if handler in self._update_handlers:
+            self._update_handlers.remove(handler)
+
     # gaphas.model.Model protocol:
 
     @property
@@ -471,7 +599,7 @@ class Diagram(Element):
 
         This method is part of the :obj:`gaphas.model.Model` protocol.
         """
-        if item in self.ownedPresentation:
+        if self.lookup(item.id) is item:  # type: ignore[attr-defined]
             self._update_dirty_items(dirty_items={item})
 
     def update_now(self, _dirty_items: Collection[Presentation]) -> None:
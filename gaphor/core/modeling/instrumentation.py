@@ -0,0 +1,81 @@
+"""Opt-in instrumentation of diagram updates.
+
+Add an update handler to a diagram with :meth:`Diagram.add_update_handler`.
+After each update cycle the handler is called with the diagram and
+an :class:`UpdateStats` instance, e.g. :func:`log_update_stats`.
+Diagrams without update handlers are not instrumented.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+log = logging.getLogger(__name__)
+
+_current_stats: UpdateStats | None = None
+
+
+@dataclass
+class UpdateStats:
+    """Statistics of one diagram update cycle.
+
+    Times are in seconds.
+    """
+
+    dirty_items: int = 0
+    updated_items: int = 0
+    time_per_class: dict[type, float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
+    style_computations: int = 0
+    style_cache_hits: int = 0
+    text_layouts: int = 0
+    solver_time: float = 0.0
+    total_time: float = 0.0
+
+    @property
+    def style_cache_hit_rate(self) -> float:
+        lookups = self.style_computations + self.style_cache_hits
+        return self.style_cache_hits / lookups if lookups else 0.0
+
+    def __str__(self) -> str:
+        slowest = ", ".join(
+            f"{cls.__name__}: {t * 1000:.1f}ms"
+            for cls, t in sorted(
+                self.time_per_class.items(), key=lambda ct: ct[1], reverse=True
+            )
+        )
+        return (
+            f"{self.dirty_items} dirty, {self.updated_items} updated "
+            f"in {self.total_time * 1000:.1f}ms ({slowest}); "
+            f"{self.style_computations} style computations, "
+            f"{self.style_cache_hit_rate:.0%} style cache hits; "
+            f"{self.text_layouts} text layouts; "
+            f"solver {self.solver_time * 1000:.1f}ms"
+        )
+
+
+def current_update_stats() -> UpdateStats | None:
+    """The statistics of the instrumented update in progress, if any."""
+    return _current_stats
+
+
+def set_current_update_stats(stats: UpdateStats | None) -> UpdateStats | None:
+    """Set the statistics of the update in progress, returning the previous
+    value."""
+    global _current_stats
+    previous, _current_stats = _current_stats, stats
+    return previous
+
+
+def record_text_layout() -> None:
+    """Count a text layout, when an instrumented update is in progress."""
+    if _current_stats is not None:
+        _current_stats.text_layouts += 1
+
+
+def log_update_stats(diagram, stats: UpdateStats) -> None:
+    """Update handler that logs the update statistics."""
+    log.info("Updated diagram %s: %s", diagram.name, stats)
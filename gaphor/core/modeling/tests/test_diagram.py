@@ -111,6 +111,20 @@ def test_order_presentations_lines_are_last(diagram):
     assert list(diagram.get_all_items()) == [example, example_line]
 
 
+def test_order_new_presentations_before_lines(diagram):
+    example_line_1 = diagram.create(ExampleLine)
+    example_1 = diagram.create(Example)
+    example_line_2 = diagram.create(ExampleLine)
+    example_2 = diagram.create(Example)
+
+    assert list(diagram.get_all_items()) == [
+        example_1,
+        example_2,
+        example_line_1,
+        example_line_2,
+    ]
+
+
 def test_order_presentations_line_is_grouped(diagram):
     example_line = diagram.create(ExampleLine)
     example_1 = diagram.create(Example)
@@ -128,3 +142,143 @@ def test_order_grouped_presentations(diagram):
     example_1.parent = example_2
 
     assert list(diagram.get_all_items()) == [example_2, example_1]
+
+
+def test_order_nested_presentations(diagram):
+    example_1 = diagram.create(Example)
+    example_2 = diagram.create(Example)
+    example_3 = diagram.create(Example)
+    example_line = diagram.create(ExampleLine)
+
+    example_1.parent = example_3
+    example_3.parent = example_2
+
+    assert list(diagram.get_all_items()) == [
+        example_2,
+        example_3,
+        example_1,
+        example_line,
+    ]
+
+
+def test_lookup_presentation(diagram):
+    example = diagram.create(Example)
+
+    assert diagram.lookup(example.id) is example
+
+    example.unlink()
+
+    assert diagram.lookup(example.id) is None
+
+
+def test_lookup_unknown_presentation(diagram):
+    diagram.create(Example)
+
+    assert diagram.lookup("unknown") is None
+
+
+def test_lookup_presentation_without_events(element_factory):
+    diagram = element_factory.create(Diagram)
+    with element_factory.block_events():
+        example = diagram.create(Example)
+
+    assert diagram.lookup(example.id) is example
+
+
+def test_lookup_presentation_replaced_without_events(element_factory):
+    diagram = element_factory.create(Diagram)
+    removed = diagram.create(Example)
+    with element_factory.block_events():
+        removed.unlink()
+        added = diagram.create(Example)
+
+    assert diagram.lookup(removed.id) is None
+    assert diagram.lookup(added.id) is added
+
+
+def test_lookup_presentation_added_without_events(element_factory):
+    diagram = element_factory.create(Diagram)
+    with element_factory.block_events():
+        example = element_factory.create_as(Example, "example", diagram=diagram)
+
+    assert diagram.lookup("unknown") is None
+    assert diagram.lookup(example.id) is example
+
+
+class UpdatedExample(Example):
+    def __init__(self, diagram, id):
+        super().__init__(diagram, id)
+        self.updates = 0
+
+    def update(self, context):
+        self.updates += 1
+
+
+def test_bulk_create_defers_update(diagram):
+    with diagram.bulk_create():
+        example_1 = diagram.create(UpdatedExample)
+        example_2 = diagram.create(UpdatedExample)
+
+        assert example_1.updates == 0
+        assert example_2.updates == 0
+
+    assert example_1.updates == 1
+    assert example_2.updates == 1
+
+
+def test_bulk_create_is_reentrant(diagram):
+    with diagram.bulk_create():
+        with diagram.bulk_create():
+            example = diagram.create(UpdatedExample)
+
+        assert example.updates == 0
+
+    assert example.updates == 1
+
+
+def test_update_handler_reports_update_stats(diagram):
+    reports = []
+    example = diagram.create(UpdatedExample)
+    diagram.add_update_handler(lambda d, stats: reports.append((d, stats)))
+
+    diagram.request_update(example)
+    diagram.update()
+
+    (d, stats), *_ = reports
+    assert d is diagram
+    assert stats.dirty_items == 1
+    assert stats.updated_items == 1
+    assert UpdatedExample in stats.time_per_class
+
+
+def test_update_handler_reports_style_lookups_per_update(diagram, element_factory):
+    element_factory.create(StyleSheet)
+    reports = []
+    example = diagram.create(UpdatedExample)
+    diagram.add_update_handler(lambda d, stats: reports.append(stats))
+
+    diagram.request_update(example)
+    diagram.update()
+    diagram.request_update(example)
+    diagram.update()
+
+    first, second = reports
+    assert first.style_computations
+    assert second.style_computations == first.style_computations
+    assert second.style_cache_hits == first.style_cache_hits
+
+
+def test_remove_update_handler(diagram):
+    reports = []
+    example = diagram.create(UpdatedExample)
+
+    def handler(diagram, stats):
+        reports.append(stats)
+
+    diagram.add_update_handler(handler)
+    diagram.remove_update_handler(handler)
+
+    diagram.request_update(example)
+    diagram.update()
+
+    assert not reports
@@ -14,7 +14,8 @@ to also create a copy of its subject.
 
 The `paste()` dispatch function works in two parts. First it creates the element
 and yields it. On the next invocation it will populate the element and perform
-complete the model loading.
+complete the model loading. All elements are created before any of them is
+populated, so references between pasted elements can always be resolved.
 
 `copy()` and `paste()` use `Element`'s `save()` and `load()` methods.
 """
@@ -51,12 +52,20 @@ def copy_full(
         for o in e.ownedElement:
             if o.owner is e:
                 for ref, data in copy(o):
-                    if ref not in elements:
-                        elements[ref] = data
-                        copy_owned(o)
+                    yield ref, data, o
 
+    # Walk the ownership tree depth-first, without recursion
     for ref in list(elements.keys()):
-        copy_owned(lookup(ref))
+        stack = [copy_owned(lookup(ref))]
+        while stack:
+            try:
+                ref, data, owned = next(stack[-1])
+            except StopIteration:
+                stack.pop()
+                continue
+            if ref not in elements:
+                elements[ref] = data
+                stack.append(copy_owned(owned))
 
     return CopyData(elements=elements, diagram_refs=diagram_refs)
 
@@ -201,7 +210,7 @@ def _paste_presentation(copy_data: PresentationCopy, _diagram, lookup):
     for name, ser in data.items():
         for value in deserialize(ser, lookup):
             item.load(name, value)
-    diagram.update({item})
+    diagram.request_update(item)
 
 
 def _paste(copy_data: Opaque, diagram: Diagram, full: bool) -> set[Presentation]:
@@ -217,29 +226,34 @@ def _paste(copy_data: Opaque, diagram: Diagram, full: bool) -> set[Presentation]
             return new_elements[ref]
 
         looked_up = model.lookup(ref)
-        if not full and looked_up and not isinstance(looked_up, Presentation):
-            return looked_up
-
-        if ref in copy_data.elements:
-            paster = paste(copy_data.elements[ref], diagram, element_lookup)
-            new_elements[ref] = next(paster)
-            next(paster, None)
-            return new_elements[ref]
-
-        if full and looked_up and not isinstance(looked_up, Presentation):
+        if looked_up and not isinstance(looked_up, Presentation):
             return looked_up
 
         if looked_up := diagram.lookup(ref):
             return looked_up
 
-    for old_id in copy_data.elements.keys():
-        if old_id in new_elements:
-            continue
-        element_lookup(old_id)
+    def should_paste(ref: Id):
+        if ref in new_elements:
+            return False
+        looked_up = model.lookup(ref)
+        return full or not looked_up or isinstance(looked_up, Presentation)
+
+    with diagram.bulk_create():
+        # First create all elements, so references can be resolved
+        # when the elements are populated.
+        pasters = []
+        for ref, data in copy_data.elements.items():
+            if should_paste(ref):
+                paster = paste(data, diagram, element_lookup)
+                new_elements[ref] = next(paster)
+                pasters.append(paster)
+
+        for paster in pasters:
+            next(paster, None)
 
-    for element in new_elements.values():
-        assert element
-        element.postload()
+        for element in new_elements.values():
+            assert element
+            element.postload()
 
     return {
         e
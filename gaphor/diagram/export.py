@@ -1,11 +1,20 @@
 """Service dedicated to exporting diagrams to a variety of file formats."""
 
+from __future__ import annotations
+
+import hashlib
+import json
+import os
 import re
+from functools import partial
+from pathlib import Path
 
 import cairo
 from gaphas.geometry import Rectangle
-from gaphas.painter import FreeHandPainter, PainterChain
+from gaphas.painter import FreeHandPainter
 
+from gaphor.core.modeling import Diagram, Element, Presentation
+from gaphor.core.modeling.collection import collection
 from gaphor.core.modeling.diagram import StyledDiagram
 from gaphor.diagram.painter import DiagramTypePainter, ItemPainter
 
@@ -15,84 +24,235 @@ def escape_filename(diagram_name):
 
 
 def render(diagram, new_surface, padding=8, write_to_png=None) -> None:
-    diagram.update(diagram.ownedPresentation)
+    recording = DiagramRecording(diagram, padding)
+    recording.replay(new_surface, write_to_png)
 
-    painter = new_painter(diagram)
 
-    # Update bounding boxes with a temporary Cairo Context
-    # (used for stuff like calculating font metrics)
-    bounding_box = calc_bounding_box(diagram, painter)
-    type_padding = diagram_type_height(diagram)
+def render_many(diagram, outfiles, padding=8) -> None:
+    """Render a diagram to multiple file formats.
 
-    w, h = (
-        bounding_box.width + 2 * padding,
-        bounding_box.height + 2 * padding + type_padding,
-    )
+    ``outfiles`` maps a file format (``svg``, ``pdf``, ``png`` or ``eps``)
+    to a file name. The diagram is updated, laid out and painted only once.
+    """
+    recording = DiagramRecording(diagram, padding)
+    for format, filename in outfiles.items():
+        try:
+            new_surface = SURFACE_FACTORIES[format]
+        except KeyError:
+            raise ValueError(f"Unknown file format: {format}") from None
+        recording.replay(
+            partial(new_surface, filename),
+            write_to_png=filename if format == "png" else None,
+        )
 
-    with new_surface(w, h) as surface:
-        cr = cairo.Context(surface)
 
-        bg_color = diagram.style(StyledDiagram(diagram)).get("background-color")
-        if bg_color and bg_color[3]:
-            cr.rectangle(0, 0, w, h)
-            cr.set_source_rgba(*bg_color)
-            cr.fill()
+class DiagramRecording:
+    """A diagram, painted once on recording surfaces.
 
-        cr.translate(
-            -bounding_box.x + padding, -bounding_box.y + padding + type_padding
-        )
-        painter.paint(diagram.get_all_items(), cr)
-        cr.show_page()
+    The recording is used to determine the bounding box (this also takes
+    care of things like font metrics) and can be replayed on any number of
+    (SVG, PDF, PNG) surfaces.
+    """
+
+    def __init__(self, diagram, padding=8):
+        diagram.update(diagram.ownedPresentation)
+
+        self.diagram = diagram
+        self.padding = padding
+        self.items = record(diagram, new_painter(diagram))
+        self.diagram_type = record(diagram, DiagramTypePainter(diagram))
 
-        if write_to_png:
-            surface.write_to_png(write_to_png)
+        self.bounding_box = Rectangle(*self.items.ink_extents())
+        _x, _y, type_width, type_height = self.diagram_type.ink_extents()
+        self.type_padding = type_height if diagram.diagramType else 0
+        self.width = max(self.bounding_box.width + 2 * padding, type_width)
+        self.height = self.bounding_box.height + 2 * padding + self.type_padding
 
+    def replay(self, new_surface, write_to_png=None) -> None:
+        w, h = self.width, self.height
+        bounding_box = self.bounding_box
 
-def diagram_type_height(diagram):
-    if not diagram.diagramType:
-        return 0
+        with new_surface(w, h) as surface:
+            cr = cairo.Context(surface)
 
-    bounding_box = calc_bounding_box(diagram, DiagramTypePainter(diagram))
+            bg_color = self.diagram.style(StyledDiagram(self.diagram)).get(
+                "background-color"
+            )
+            if bg_color and bg_color[3]:
+                cr.rectangle(0, 0, w, h)
+                cr.set_source_rgba(*bg_color)
+                cr.fill()
 
-    return bounding_box.height
+            cr.set_source_surface(
+                self.items,
+                -bounding_box.x + self.padding,
+                -bounding_box.y + self.padding + self.type_padding,
+            )
+            cr.paint()
+            cr.set_source_surface(self.diagram_type, 0, 0)
+            cr.paint()
+            cr.show_page()
 
+            if write_to_png:
+                surface.write_to_png(write_to_png)
 
-def calc_bounding_box(diagram, painter):
+
+def record(diagram, painter) -> cairo.RecordingSurface:
+    """Paint all diagram items on an unbounded recording surface."""
     surface = cairo.RecordingSurface(cairo.Content.COLOR_ALPHA, None)
     cr = cairo.Context(surface)
     painter.paint(diagram.get_all_items(), cr)
-    return Rectangle(*surface.ink_extents())
+    return surface
+
+
+def new_svg_surface(filename, w, h):
+    return cairo.SVGSurface(filename, w, h)
+
+
+def new_png_surface(_filename, w, h):
+    return cairo.ImageSurface(cairo.FORMAT_ARGB32, int(w + 1), int(h + 1))
+
+
+def new_pdf_surface(filename, w, h):
+    return cairo.PDFSurface(filename, w, h)
+
+
+def new_eps_surface(filename, w, h):
+    surface = cairo.PSSurface(filename, w, h)
+    surface.set_eps(True)
+    return surface
+
+
+SURFACE_FACTORIES = {
+    "svg": new_svg_surface,
+    "png": new_png_surface,
+    "pdf": new_pdf_surface,
+    "eps": new_eps_surface,
+}
 
 
 def save_svg(filename, diagram):
-    render(diagram, lambda w, h: cairo.SVGSurface(filename, w, h))
+    render_many(diagram, {"svg": filename})
 
 
 def save_png(filename, diagram):
-    render(
-        diagram,
-        lambda w, h: cairo.ImageSurface(cairo.FORMAT_ARGB32, int(w + 1), int(h + 1)),
-        write_to_png=filename,
-    )
+    render_many(diagram, {"png": filename})
 
 
 def save_pdf(filename, diagram):
-    render(diagram, lambda w, h: cairo.PDFSurface(filename, w, h))
+    render_many(diagram, {"pdf": filename})
 
 
 def save_eps(filename, diagram):
-    def new_surface(w, h):
-        surface = cairo.PSSurface(filename, w, h)
-        surface.set_eps(True)
-        return surface
-
-    render(diagram, new_surface)
+    render_many(diagram, {"eps": filename})
 
 
 def new_painter(diagram):
     style = diagram.style(StyledDiagram(diagram))
     sloppiness = style.get("line-style", 0.0)
-    item_painter = (
-        FreeHandPainter(ItemPainter(), sloppiness) if sloppiness else ItemPainter()
-    )
-    return PainterChain().append(item_painter).append(DiagramTypePainter(diagram))
+    return FreeHandPainter(ItemPainter(), sloppiness) if sloppiness else ItemPainter()
+
+
+def diagram_fingerprint(diagram: Diagram) -> str:
+    """Compute a stable fingerprint of everything rendered in a diagram.
+
+    The fingerprint covers the diagram itself, its presentation items,
+    their subjects and all elements referenced from those, and the style
+    sheet. Other diagrams and their presentation items are not included.
+    If the fingerprint did not change, the rendered output will not change
+    either.
+    """
+    digest = hashlib.sha256()
+    seen: set[Element] = set()
+    pending: list[Element] = []
+
+    def save_func(name, value):
+        if isinstance(value, Element):
+            pending.append(value)
+            value = value.id
+        elif isinstance(value, collection):
+            pending.extend(value)
+            value = [v.id for v in value]
+        digest.update(f"{name}={value!r};".encode())
+
+    def update(element: Element) -> None:
+        seen.add(element)
+        digest.update(f"{type(element).__name__}:{element.id}(".encode())
+        element.save(save_func)
+        digest.update(b")")
+
+    if style_sheet := diagram.styleSheet:
+        update(style_sheet)
+    update(diagram)
+    for item in diagram.ownedPresentation:
+        update(item)
+    while pending:
+        element = pending.pop()
+        if element not in seen and not isinstance(element, (Diagram, Presentation)):
+            update(element)
+
+    return digest.hexdigest()
+
+
+class ExportManifest:
+    """Keep track of the fingerprints of exported diagrams.
+
+    The manifest is stored as a JSON file next to the exported files.
+    It is used to skip rendering of diagrams that did not change since
+    the previous export. All entries are discarded if the manifest was
+    written by a different version of Gaphor.
+    """
+
+    FILENAME = ".gaphor-export.json"
+
+    def __init__(self, directory: str | os.PathLike, version: str):
+        self.path = Path(directory) / self.FILENAME
+        self.version = version
+        self._fingerprints: dict[str, str] = self._read()
+
+    def _read(self) -> dict[str, str]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("gaphor-version") != self.version:
+            return {}
+        fingerprints = data.get("fingerprints")
+        return fingerprints if isinstance(fingerprints, dict) else {}
+
+    def _key(self, filename: str | os.PathLike) -> str:
+        path = Path(filename).resolve()
+        try:
+            return path.relative_to(self.path.parent.resolve()).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def up_to_date(self, filename: str | os.PathLike, fingerprint: str) -> bool:
+        """Check if ``filename`` exists and was rendered from ``fingerprint``."""
+        return (
+            self._fingerprints.get(self._key(filename)) == fingerprint
+            and Path(filename).exists()
+        )
+
+    def update(self, filename: str | os.PathLike, fingerprint: str) -> None:
+        self._fingerprints[self._key(filename)] = fingerprint
+
+    def save(self) -> None:
+        """Write the manifest.
+
+        Entries written by other processes in the mean time are retained,
+        so exports can safely run in parallel.
+        """
+        fingerprints = {**self._read(), **self._fingerprints}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}")
+        tmp_path.write_text(
+            json.dumps(
+                {"gaphor-version": self.version, "fingerprints": fingerprints},
+                indent=1,
+                sort_keys=True,
+            ),
+            encoding="utf-8",
+        )
+        tmp_path.replace(self.path)
+        self._fingerprints = fingerprints
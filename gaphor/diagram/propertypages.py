@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import abc
 import textwrap
-from typing import Callable, List, Tuple, Type
+from typing import Callable, Dict, List, Tuple, Type
 
 import gaphas.item
 from gaphas.segment import Segment
@@ -53,25 +53,40 @@ new_builder = new_resource_builder("gaphor.diagram")
 class _PropertyPages:
     """Generic handler for property pages.
 
-    Property pages are collected on type.
+    Property pages are collected on type. The factories that apply to a
+    concrete class are cached, the cache is invalidated on registration.
     """
 
     def __init__(self) -> None:
         self.pages: List[
             Tuple[Type[Element], Callable[[Element], PropertyPageBase]]
         ] = []
+        self._factories: Dict[type, List[Callable[[Element], PropertyPageBase]]] = {}
 
     def register(self, subject_type, func=None):
         def reg(func):
             self.pages.append((subject_type, func))
+            self._factories.clear()
             return func
 
         return reg(func) if func else reg
 
+    def factories(self, cls: type) -> List[Callable[[Element], PropertyPageBase]]:
+        """The page factories that apply to instances of ``cls``, in
+        registration order."""
+        try:
+            return self._factories[cls]
+        except KeyError:
+            factories = self._factories[cls] = [
+                func
+                for subject_type, func in self.pages
+                if issubclass(cls, subject_type)
+            ]
+            return factories
+
     def __call__(self, subject):
-        for subject_type, func in self.pages:
-            if isinstance(subject, subject_type):
-                yield func(subject)
+        for func in self.factories(type(subject)):
+            yield func(subject)
 
 
 PropertyPages = _PropertyPages()
@@ -92,6 +107,16 @@ class PropertyPageBase(abc.ABC):
         Returns the page's toplevel widget (Gtk.Widget).
         """
 
+    def rebind(self, page: PropertyPageBase) -> bool:
+        """Rebind the widget constructed by this page to the subject of
+        ``page``, a newly created page of the same class.
+
+        The element editor keeps pages that support rebinding, so their
+        widgets can be reused when the selection changes. Returns
+        ``True`` if the page has been rebound.
+        """
+        return False
+
 
 def help_link(builder, help_widget, popover):
     """Show the help popover for a `Help` link in the property page."""
@@ -144,34 +169,63 @@ class NamePropertyPage(PropertyPageBase):
         super().__init__()
         self.subject = subject
         self.watcher = subject.watcher() if subject else None
+        self.entry: Gtk.Entry | None = None
 
     def construct(self):
         if not self.subject:
             return
 
-        assert self.watcher
         builder = new_builder(
             "name-editor",
         )
 
+        self.entry = builder.get_object("name-entry")
+        self.type_label = builder.get_object("type-label")
+        self._blocking = handler_blocking(self.entry, "changed", self._on_name_changed)
+        self._bind()
+
+        name_editor = builder.get_object("name-editor")
+        name_editor.connect("notify::parent", self._on_parent_changed)
+        return name_editor
+
+    def rebind(self, page):
+        if not (self.entry and page.subject):
+            return False
+
+        if self.watcher:
+            self.watcher.unsubscribe_all()
+        self.subject = page.subject
+        self.watcher = page.watcher
+        self._bind()
+        return True
+
+    def _bind(self):
+        assert self.entry
+        assert self.watcher
         subject = self.subject
+        entry = self.entry
 
-        entry = builder.get_object("name-entry")
-        entry.set_text(subject and subject.name or "")
+        @self._blocking
+        def set_text(text):
+            if text != entry.get_text():
+                entry.set_text(text)
 
-        type = builder.get_object("type-label")
-        type.set_text(subject.__class__.__name__)
+        set_text(subject.name or "")
+        self.type_label.set_text(subject.__class__.__name__)
 
-        @handler_blocking(entry, "changed", self._on_name_changed)
         def handler(event):
-            if event.element is subject and event.new_value != entry.get_text():
-                entry.set_text(event.new_value or "")
+            if event.element is subject:
+                set_text(event.new_value or "")
 
         self.watcher.watch("name", handler)
 
-        return unsubscribe_all_on_destroy(
-            builder.get_object("name-editor"), self.watcher
-        )
+    def _on_parent_changed(self, widget, _pspec):
+        # Release the subject: the page may be kept for reuse
+        if not widget.props.parent:
+            if self.watcher:
+                self.watcher.unsubscribe_all()
+            self.subject = None
+            self.watcher = None
 
     @transactional
     def _on_name_changed(self, entry):
@@ -235,30 +289,59 @@ class NotePropertyPage(PropertyPageBase):
     def __init__(self, subject):
         self.subject = subject.subject if isinstance(subject, Presentation) else subject
         self.watcher = self.subject and self.subject.watcher()
+        self.text_view: Gtk.TextView | None = None
 
     def construct(self):
-        subject = self.subject
-
-        if not subject:
+        if not self.subject:
             return
 
         builder = new_builder("note-editor")
-        text_view = builder.get_object("note")
+        self.text_view = builder.get_object("note")
 
         buffer = Gtk.TextBuffer()
-        if subject.note:
-            buffer.set_text(subject.note)
-        text_view.set_buffer(buffer)
+        self.text_view.set_buffer(buffer)
+        self._blocking = handler_blocking(buffer, "changed", self._on_body_change)
+        self._bind()
+
+        note_editor = builder.get_object("note-editor")
+        note_editor.connect("notify::parent", self._on_parent_changed)
+        return note_editor
+
+    def rebind(self, page):
+        if not (self.text_view and page.subject):
+            return False
+
+        if self.watcher:
+            self.watcher.unsubscribe_all()
+        self.subject = page.subject
+        self.watcher = page.watcher
+        self._bind()
+        return True
+
+    def _bind(self):
+        assert self.text_view
+        text_view = self.text_view
+        buffer = text_view.get_buffer()
+
+        @self._blocking
+        def set_text(text):
+            buffer.set_text(text)
+
+        set_text(self.subject.note or "")
 
-        @handler_blocking(buffer, "changed", self._on_body_change)
         def handler(event):
             if not text_view.props.has_focus:
-                buffer.set_text(event.new_value or "")
+                set_text(event.new_value or "")
 
         self.watcher.watch("note", handler)
-        text_view.connect("destroy", self.watcher.unsubscribe_all)
 
-        return builder.get_object("note-editor")
+    def _on_parent_changed(self, widget, _pspec):
+        # Release the subject: the page may be kept for reuse
+        if not widget.props.parent:
+            if self.watcher:
+                self.watcher.unsubscribe_all()
+            self.subject = None
+            self.watcher = None
 
     @transactional
     def _on_body_change(self, buffer):
@@ -278,15 +361,37 @@ class InternalsPropertyPage(PropertyPageBase):
 
     def __init__(self, subject):
         self.subject = subject
+        self.internals: Gtk.Label | None = None
 
     def construct(self):
-        subject = self.subject
-
-        if not subject:
+        if not self.subject:
             return
 
         builder = new_builder("internals-editor")
-        internals = builder.get_object("internals")
+        self.internals = builder.get_object("internals")
+        self._bind()
+
+        internals_editor = builder.get_object("internals-editor")
+        internals_editor.connect("notify::parent", self._on_parent_changed)
+        return internals_editor
+
+    def rebind(self, page):
+        if not (self.internals and page.subject):
+            return False
+
+        self.subject = page.subject
+        self._bind()
+        return True
+
+    def _on_parent_changed(self, widget, _pspec):
+        # Release the subject: the page may be kept for reuse
+        if not widget.props.parent:
+            self.subject = None
+
+    def _bind(self):
+        assert self.internals
+        subject = self.subject
+        internals = self.internals
 
         if isinstance(subject, Presentation):
             presentation_text = textwrap.dedent(
@@ -317,8 +422,6 @@ class InternalsPropertyPage(PropertyPageBase):
         else:
             internals.set_label(presentation_text or element_text)
 
-        return builder.get_object("internals-editor")
-
 
 def presentation_class(subject):
     t = type(subject)
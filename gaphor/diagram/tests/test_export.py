@@ -1,7 +1,12 @@
 import pytest
 
+from gaphor import UML
+from gaphor.core.modeling import Diagram
 from gaphor.diagram.export import (
+    ExportManifest,
+    diagram_fingerprint,
     escape_filename,
+    render_many,
     save_eps,
     save_pdf,
     save_png,
@@ -52,8 +57,125 @@ def test_export_to_eps(diagram_with_box, tmp_path):
     assert b"%!PS-Adobe-3.0 EPSF-3.0" in content
 
 
+def test_export_to_many_formats(diagram_with_box, tmp_path):
+    svg = tmp_path / "test.svg"
+    pdf = tmp_path / "test.pdf"
+    png = tmp_path / "test.png"
+
+    render_many(diagram_with_box, {"svg": svg, "pdf": pdf, "png": png})
+
+    assert "<svg" in svg.read_text(encoding="utf-8")
+    assert b"%PDF" in pdf.read_bytes()
+    assert b"PNG" in png.read_bytes()
+
+
+def test_export_to_unknown_format(diagram_with_box, tmp_path):
+    with pytest.raises(ValueError):
+        render_many(diagram_with_box, {"xyz": tmp_path / "test.xyz"})
+
+
 def test_escape_filename():
     assert escape_filename("foo bar") == "foo_bar"
     assert escape_filename(r"foo \ bar >") == "foo_bar_"
     assert escape_filename("çëÆØ") == "çëÆØ"
     assert escape_filename("こんにちは") == "こんにちは"  # should read: "hello"
+
+
+def test_fingerprint_is_stable(diagram_with_box):
+    assert diagram_fingerprint(diagram_with_box) == diagram_fingerprint(
+        diagram_with_box
+    )
+
+
+def test_fingerprint_changes_with_presentation(diagram_with_box):
+    fingerprint = diagram_fingerprint(diagram_with_box)
+    box = next(diagram_with_box.select(Box))
+
+    box.width = box.width + 10
+
+    assert diagram_fingerprint(diagram_with_box) != fingerprint
+
+
+def test_fingerprint_changes_with_diagram_name(diagram_with_box):
+    fingerprint = diagram_fingerprint(diagram_with_box)
+
+    diagram_with_box.name = "New name"
+
+    assert diagram_fingerprint(diagram_with_box) != fingerprint
+
+
+def test_fingerprint_changes_with_attribute_name(diagram, element_factory):
+    package = element_factory.create(UML.Package)
+    klass = element_factory.create(UML.Class)
+    klass.package = package
+    attribute = element_factory.create(UML.Property)
+    attribute.name = "a"
+    klass.ownedAttribute = attribute
+    diagram.element = package
+    diagram.create(Box, subject=klass)
+    fingerprint = diagram_fingerprint(diagram)
+
+    attribute.name = "b"
+
+    assert diagram_fingerprint(diagram) != fingerprint
+
+
+def test_fingerprint_changes_with_parameter_type_name(diagram, element_factory):
+    klass = element_factory.create(UML.Class)
+    operation = element_factory.create(UML.Operation)
+    parameter = element_factory.create(UML.Parameter)
+    parameter_type = element_factory.create(UML.Class)
+    parameter_type.name = "A"
+    parameter.type = parameter_type
+    operation.ownedParameter = parameter
+    klass.ownedOperation = operation
+    diagram.create(Box, subject=klass)
+    fingerprint = diagram_fingerprint(diagram)
+
+    parameter_type.name = "B"
+
+    assert diagram_fingerprint(diagram) != fingerprint
+
+
+def test_fingerprint_ignores_other_diagrams(diagram, element_factory):
+    klass = element_factory.create(UML.Class)
+    diagram.create(Box, subject=klass)
+    other_diagram = element_factory.create(Diagram)
+    other_box = other_diagram.create(Box, subject=klass)
+    fingerprint = diagram_fingerprint(diagram)
+
+    other_box.width = other_box.width + 10
+
+    assert diagram_fingerprint(diagram) == fingerprint
+
+
+def test_manifest_up_to_date(tmp_path):
+    f = tmp_path / "test.svg"
+    f.write_text("<svg/>", encoding="utf-8")
+
+    manifest = ExportManifest(tmp_path, "1.0")
+    manifest.update(f, "abc")
+    manifest.save()
+
+    assert ExportManifest(tmp_path, "1.0").up_to_date(f, "abc")
+    assert not ExportManifest(tmp_path, "1.0").up_to_date(f, "def")
+
+
+def test_manifest_not_up_to_date_for_other_version(tmp_path):
+    f = tmp_path / "test.svg"
+    f.write_text("<svg/>", encoding="utf-8")
+
+    manifest = ExportManifest(tmp_path, "1.0")
+    manifest.update(f, "abc")
+    manifest.save()
+
+    assert not ExportManifest(tmp_path, "2.0").up_to_date(f, "abc")
+
+
+def test_manifest_not_up_to_date_for_missing_file(tmp_path):
+    f = tmp_path / "test.svg"
+
+    manifest = ExportManifest(tmp_path, "1.0")
+    manifest.update(f, "abc")
+
+    assert not manifest.up_to_date(f, "abc")
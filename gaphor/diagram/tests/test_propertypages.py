@@ -1,10 +1,11 @@
-from gaphor.core.modeling import Comment, Diagram
+from gaphor.core.modeling import Comment, Diagram, Element
 from gaphor.diagram.general import CommentItem, Line
 from gaphor.diagram.propertypages import (
     InternalsPropertyPage,
     LineStylePage,
     NamePropertyPage,
     NotePropertyPage,
+    _PropertyPages,
 )
 from gaphor.diagram.tests.fixtures import find
 
@@ -80,3 +81,67 @@ def test_internals_page_for_presentation(create):
 
     assert "CommentItem" in text
     assert "gaphor.core.modeling.coremodel.Comment" in text
+
+
+def test_name_page_rebind(element_factory):
+    diagram = element_factory.create(Diagram)
+    other = element_factory.create(Diagram)
+    other.name = "other"
+    property_page = NamePropertyPage(diagram)
+    widget = property_page.construct()
+
+    assert property_page.rebind(NamePropertyPage(other))
+
+    name = find(widget, "name-entry")
+    assert name.get_text() == "other"
+
+    name.set_text("A new name")
+
+    assert other.name == "A new name"
+    assert diagram.name is None
+
+    diagram.name = "diagram"
+
+    assert name.get_text() == "A new name"
+
+
+def test_note_page_rebind(create):
+    item = create(CommentItem, Comment)
+    other = create(CommentItem, Comment)
+    other.subject.note = "other"
+    property_page = NotePropertyPage(item)
+    widget = property_page.construct()
+
+    assert property_page.rebind(NotePropertyPage(other))
+
+    buffer = find(widget, "note").get_buffer()
+    text = buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter(), False)
+
+    assert text == "other"
+    assert item.subject.note is None
+
+
+def test_property_pages_factories_are_cached():
+    property_pages = _PropertyPages()
+
+    class Base(Element):
+        pass
+
+    class Sub(Base):
+        pass
+
+    def base_page(subject):
+        return None
+
+    def sub_page(subject):
+        return None
+
+    property_pages.register(Base, base_page)
+
+    assert property_pages.factories(Sub) == [base_page]
+    assert property_pages.factories(Sub) is property_pages.factories(Sub)
+
+    property_pages.register(Sub, sub_page)
+
+    assert property_pages.factories(Sub) == [base_page, sub_page]
+    assert property_pages.factories(Base) == [base_page]
@@ -101,3 +101,48 @@ def test_text_with_just_font_as_dict():
     w, h = Layout("Example", {"font-family": "sans", "font-size": 10}).size()
     assert w
     assert h
+
+
+def test_identical_layouts_share_pango_layout():
+    font = {"font-family": "sans", "font-size": 10}
+    layout_1 = Layout("Example", font)
+    layout_2 = Layout("Example", font)
+
+    assert layout_1.layout is layout_2.layout
+    assert layout_1.size() == layout_2.size()
+
+
+def test_layout_changes_with_text():
+    font = {"font-family": "sans", "font-size": 10}
+    layout = Layout("Example", font)
+    pango_layout = layout.layout
+
+    layout.set(text="Another example")
+
+    assert layout.layout is not pango_layout
+    assert layout.layout.get_text() == "Another example"
+
+
+def test_layouts_share_font_description():
+    font = {"font-family": "sans", "font-size": 10}
+    layout_1 = Layout("Example", font)
+    layout_2 = Layout("Another example", font)
+
+    assert layout_1.layout is not layout_2.layout
+    assert layout_1.layout.get_context() is layout_2.layout.get_context()
+    assert layout_1.layout.get_font_description().equal(
+        layout_2.layout.get_font_description()
+    )
+
+
+def test_layouts_with_different_width_share_pango_layout():
+    font = {"font-family": "sans", "font-size": 10}
+    wide = Layout("Example text", font)
+    narrow = Layout("Example text", font, width=20)
+
+    wide_size = wide.size()
+    narrow_size = narrow.size()
+
+    assert wide.layout is narrow.layout
+    assert narrow_size[1] > wide_size[1]
+    assert wide.size() == wide_size
@@ -1,14 +1,30 @@
 """Support classes for dealing with text."""
 from __future__ import annotations
 
+import functools
+
 from gaphas.canvas import instant_cairo_context
 from gaphas.painter.freehand import FreeHandCairoContext
 from gi.repository import Pango, PangoCairo
 
+from gaphor.core.modeling.instrumentation import record_text_layout
 from gaphor.core.styling import FontStyle, FontWeight, Style, TextAlign, TextDecoration
 
+FontId = tuple[str, float | str, FontWeight | None, FontStyle | None, bool]
+
+# Maximum width of a Pango layout, in Pango units
+MAX_WIDTH = 2147483647
+
 
 class Layout:
+    """Text with a font, width and alignment.
+
+    Pango layouts are shared between layouts with the same text, font and
+    alignment; the width is set on the shared layout before it is used.
+    Measured text sizes are cached. Pango is not consulted as long as text,
+    font, width and alignment do not change.
+    """
+
     def __init__(
         self,
         text: str = "",
@@ -17,13 +33,12 @@ class Layout:
         text_align: TextAlign = TextAlign.CENTER,
         default_size: tuple[int, int] = (0, 0),
     ):
-        self.layout = PangoCairo.create_layout(instant_cairo_context())
-        self.font_id: (
-            tuple[str, float | str, FontWeight | None, FontStyle | None] | None
-        ) = None
+        self.font_id: FontId | None = None
         self.text = ""
-        self.width = -1
+        self.width: float = -1
+        self.text_align = text_align
         self.default_size = default_size
+        self._drawn: tuple[tuple, Pango.Layout] | None = None
 
         if text:
             self.set_text(text)
@@ -31,7 +46,6 @@ class Layout:
             self.set_width(width)
         if font:
             self.set_font(font)
-        self.set_alignment(text_align)
 
     def set(self, text=None, font=None, width=None, text_align=None):
         # Since text expressions can return False, we should also accommodate for that
@@ -47,69 +61,47 @@ class Layout:
     def set_font(self, font: Style) -> None:
         font_family = font.get("font-family")
         font_size = font.get("font-size")
-        font_weight = font.get("font-weight")
-        font_style = font.get("font-style")
         assert font_family, "Font family should be set"
         assert font_size, "Font size should be set"
 
-        font_id = (font_family, font_size, font_weight, font_style)
-        if font_id == self.font_id:
-            return
-
-        self.font_id = font_id
-
-        fd = Pango.FontDescription.new()
-        fd.set_family(font_family)
-        fd.set_absolute_size(font_size * Pango.SCALE)
-
-        if font_weight:
-            assert isinstance(font_weight, FontWeight)
-            fd.set_weight(getattr(Pango.Weight, font_weight.name))
-        if font_style:
-            assert isinstance(font_style, FontStyle)
-            fd.set_style(getattr(Pango.Style, font_style.name))
-
-        self.layout.set_font_description(fd)
-
-        underline = (
-            font.get("text-decoration", TextDecoration.NONE) == TextDecoration.UNDERLINE
+        self.font_id = (
+            font_family,
+            font_size,
+            font.get("font-weight"),
+            font.get("font-style"),
+            font.get("text-decoration", TextDecoration.NONE)
+            == TextDecoration.UNDERLINE,
         )
 
-        attrs = Pango.AttrList.new()
-        attrs.insert(
-            Pango.attr_underline_new(
-                Pango.Underline.SINGLE if underline else Pango.Underline.NONE
-            )
-        )
-        self.layout.set_attributes(attrs)
-
     def set_text(self, text: str) -> None:
-        if text != self.text:
-            self.text = text
-            self.layout.set_text(self.text, length=-1)
+        self.text = text
 
-    def set_width(self, width: int) -> None:
+    def set_width(self, width: float) -> None:
         self.width = width
-        if width == -1:
-            self.layout.set_width(-1)
-        else:
-            self.layout.set_width(int(width * Pango.SCALE))
 
     def set_alignment(self, text_align: TextAlign) -> None:
-        self.layout.set_alignment(getattr(Pango.Alignment, text_align.name))
+        self.text_align = text_align
+
+    @property
+    def layout(self) -> Pango.Layout:
+        return _sized_layout(self.text, self.font_id, self.width, self.text_align)
 
     def size(self) -> tuple[int, int]:
         if not self.text:
             return self.default_size
-        self.set_width(self.width)
-        return self.layout.get_pixel_size()  # type: ignore[no-any-return]
+        return _text_size(self.text, self.font_id, self.width, self.text_align)
 
     def show_layout(self, cr, width=None, default_size=None):
-        layout = self.layout
         if not self.text:
             return default_size or self.default_size
-        if width is not None:
-            layout.set_width(min(int(width * Pango.SCALE), 2147483647))
+        key = (self.text, self.font_id, self.text_align)
+        # Hold on to the layout, so drawing does not depend on the shared cache
+        if self._drawn and self._drawn[0] == key:
+            layout = self._drawn[1]
+        else:
+            layout = _pango_layout(*key)
+            self._drawn = (key, layout)
+        layout.set_width(_pango_width(self.width if width is None else width))
 
         if isinstance(cr, FreeHandCairoContext):
             PangoCairo.show_layout(cr.cr, layout)
@@ -117,6 +109,73 @@ class Layout:
             PangoCairo.show_layout(cr, layout)
 
 
+@functools.lru_cache(maxsize=4096)
+def _pango_layout(
+    text: str, font_id: FontId | None, text_align: TextAlign
+) -> Pango.Layout:
+    layout = Pango.Layout.new(_pango_context())
+    if font_id:
+        layout.set_font_description(_font_description(font_id))
+        layout.set_attributes(_attributes(font_id[4]))
+
+    layout.set_text(text, length=-1)
+    layout.set_alignment(getattr(Pango.Alignment, text_align.name))
+    return layout
+
+
+def _sized_layout(
+    text: str, font_id: FontId | None, width: float, text_align: TextAlign
+) -> Pango.Layout:
+    layout = _pango_layout(text, font_id, text_align)
+    layout.set_width(_pango_width(width))
+    return layout
+
+
+def _pango_width(width: float) -> int:
+    return -1 if width == -1 else min(int(width * Pango.SCALE), MAX_WIDTH)
+
+
+@functools.cache
+def _pango_context() -> Pango.Context:
+    return PangoCairo.create_context(instant_cairo_context())
+
+
+@functools.cache
+def _font_description(font_id: FontId) -> Pango.FontDescription:
+    font_family, font_size, font_weight, font_style, _underline = font_id
+    fd = Pango.FontDescription.new()
+    fd.set_family(font_family)
+    fd.set_absolute_size(font_size * Pango.SCALE)
+
+    if font_weight:
+        assert isinstance(font_weight, FontWeight)
+        fd.set_weight(getattr(Pango.Weight, font_weight.name))
+    if font_style:
+        assert isinstance(font_style, FontStyle)
+        fd.set_style(getattr(Pango.Style, font_style.name))
+
+    return fd
+
+
+@functools.cache
+def _attributes(underline: bool) -> Pango.AttrList:
+    attrs = Pango.AttrList.new()
+    attrs.insert(
+        Pango.attr_underline_new(
+            Pango.Underline.SINGLE if underline else Pango.Underline.NONE
+        )
+    )
+    return attrs
+
+
+@functools.lru_cache(maxsize=16384)
+def _text_size(
+    text: str, font_id: FontId | None, width: float, text_align: TextAlign
+) -> tuple[int, int]:
+    record_text_layout()
+    return _sized_layout(text, font_id, width, text_align).get_pixel_size()  # type: ignore[no-any-return]
+
+
 def text_point_at_line(points, size, text_align):
     """Provide a position (x, y) to draw a text close to a line.
 
@@ -35,7 +35,6 @@ def on_motion(
     subject_class: type[Element] | None,
 ):
     view: GtkView = controller.get_widget()
-    model = view.model
 
     try:
         parent = next(item_at_point(view, (x, y)), None)
@@ -43,17 +42,33 @@ def on_motion(
         parent = None
 
     if parent and subject_class:
-        view.selection.dropzone_item = (
+        set_dropzone_item(
+            view,
             parent
             if can_group(parent.subject, subject_class)
             or can_connect(parent, item_class)  # type: ignore[arg-type]
-            else None
+            else None,
         )
-        model.request_update(parent)
     else:
-        if view.selection.dropzone_item:
-            model.request_update(view.selection.dropzone_item)
-        view.selection.dropzone_item = None
+        set_dropzone_item(view, None)
+
+
+def set_dropzone_item(view: GtkView, item: Item | None) -> None:
+    """Set the drop zone item.
+
+    Motion events come in at a high rate. Only when the drop zone item
+    changes, the old and new drop zone items are updated.
+    """
+    selection = view.selection
+    old_item = selection.dropzone_item
+    if item is old_item:
+        return
+
+    selection.dropzone_item = item
+    if old_item:
+        view.model.request_update(old_item)
+    if item:
+        view.model.request_update(item)
 
 
 class DropZoneMoveMixin:
@@ -80,12 +95,11 @@ class DropZoneMoveMixin:
         )
 
         if not over_item:
-            view.selection.dropzone_item = None
+            set_dropzone_item(view, None)
             return
 
         if item.subject and can_group(over_item.subject, item.subject):
-            view.selection.dropzone_item = over_item
-            over_item.request_update()
+            set_dropzone_item(view, over_item)
 
     def stop_move(self, pos):
         """Motion stops: drop!"""
@@ -35,3 +35,22 @@ def test_grow_parent(diagram, element_factory):
 
     assert node_item.handles()[NW].pos.tuple() == (0, 0)
     assert node_item.handles()[SE].pos.tuple() == (320, 270)
+
+
+def test_hover_over_drop_zone_requests_update_once(
+    diagram, element_factory, view, monkeypatch
+):
+    node_item = diagram.create(NodeItem, subject=element_factory.create(UML.Node))
+    node_item.width = node_item.height = 200
+    view.request_update((node_item,))
+    tool = drop_zone_tool(ArtifactItem, UML.Artifact)
+    view.add_controller(tool)
+    updated = []
+    monkeypatch.setattr(diagram, "request_update", updated.append)
+
+    on_motion(tool, 100, 100, ArtifactItem, UML.Artifact)
+    on_motion(tool, 101, 101, ArtifactItem, UML.Artifact)
+    on_motion(tool, 500, 500, ArtifactItem, UML.Artifact)
+
+    assert view.selection.dropzone_item is None
+    assert updated == [node_item, node_item]
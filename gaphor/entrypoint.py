@@ -2,7 +2,7 @@ import functools
 import importlib.metadata
 import inspect
 import logging
-from typing import Dict, TypeVar
+from typing import Dict, Generic, Iterator, Mapping, TypeVar
 
 T = TypeVar("T")
 
@@ -36,9 +36,15 @@ def init_entry_points(
     defined in the constructor.
 
     Given a dictionary `{name: service-class}`, return a map `{name:
-    service-instance}`.
+    service-instance}`. Known services take precedence over entry points
+    with the same name.
     """
     ready: Dict[str, T] = known_services.copy()
+    uninitialized_services = {
+        name: cls
+        for name, cls in uninitialized_services.items()
+        if name not in known_services
+    }
 
     def pop(name):
         try:
@@ -71,3 +77,36 @@ def init_entry_points(
         init(name, cls)
 
     return ready
+
+
+class LazyEntryPoints(Mapping[str, T], Generic[T]):
+    """A mapping of entry points in a scope.
+
+    Entry points are only loaded and initialized when they are looked
+    up, so the modules that implement them are not imported up front.
+    """
+
+    def __init__(self, scope, **known_services):
+        self._scope = scope
+        self._known_services = known_services
+        self._names = list(dict.fromkeys(ep.name for ep in list_entry_points(scope)))
+        self._initialized: Dict[str, T] = {}
+
+    def __getitem__(self, name: str) -> T:
+        try:
+            return self._initialized[name]
+        except KeyError:
+            if name not in self._names:
+                raise
+        srv = initialize(self._scope, [name], **self._known_services)[name]
+        self._initialized[name] = srv
+        return srv
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import functools
+import hashlib
+import io
+import json
+import os
 from pathlib import Path
 
 import sphinx.util.docutils
@@ -9,11 +13,16 @@ from docutils.parsers.rst import directives
 from docutils.parsers.rst.directives import images
 from sphinx.util import logging
 
+from gaphor.application import Session, distribution
 from gaphor.core.modeling import Diagram, ElementFactory
-from gaphor.diagram.export import save_pdf, save_svg
+from gaphor.diagram.export import (
+    ExportManifest,
+    diagram_fingerprint,
+    render_many,
+)
 from gaphor.i18n import gettext
-from gaphor.services.modelinglanguage import ModelingLanguageService
 from gaphor.storage import storage
+from gaphor.storage.parser import GaphorLoader, element, parse_generator
 
 log = logging.getLogger(__name__)
 
@@ -66,22 +75,12 @@ class DiagramDirective(sphinx.util.docutils.SphinxDirective):
             )
 
         self.env.note_dependency(model_file)
-        model = load_model(Path(self.env.srcdir) / model_file)
 
         outdir = (Path(self.env.app.doctreedir) / ".." / "gaphor").resolve()
         outdir.mkdir(exist_ok=True)
 
-        diagram = next(
-            model.select(
-                lambda e: isinstance(e, Diagram) and ".".join(e.qualifiedName) == name
-            ),
-            None,
-        )
-
-        if not diagram:
-            diagram = next(
-                model.select(lambda e: isinstance(e, Diagram) and e.name == name), None
-            )
+        model = load_model(Path(self.env.srcdir) / model_file, outdir)
+        diagram = model.diagram(name)
 
         if not diagram:
             return self.logging_error_node(
@@ -91,8 +90,18 @@ class DiagramDirective(sphinx.util.docutils.SphinxDirective):
             )
 
         outfile = outdir / f"{diagram.id}"
-        save_svg(outfile.with_suffix(".svg"), diagram)
-        save_pdf(outfile.with_suffix(".pdf"), diagram)
+        manifest = ExportManifest(outdir, distribution().version)
+        fingerprint = diagram_fingerprint(diagram)
+        outfiles = {
+            format: outfile.with_suffix(f".{format}")
+            for format in ("svg", "pdf")
+            if not manifest.up_to_date(outfile.with_suffix(f".{format}"), fingerprint)
+        }
+        if outfiles:
+            render_many(diagram, outfiles)
+            for filename in outfiles.values():
+                manifest.update(filename, fingerprint)
+            manifest.save()
 
         # Image needs a relative path. Make our outfile path relative to the doc
         outdir = outdir.relative_to(self.env.srcdir)
@@ -112,16 +121,100 @@ class DiagramDirective(sphinx.util.docutils.SphinxDirective):
         return [nodes.error("", nodes.paragraph(text=text))]
 
 
+class Model:
+    """A loaded model, with diagrams indexed by (qualified) name."""
+
+    def __init__(self, element_factory: ElementFactory):
+        self.element_factory = element_factory
+        self._diagrams_by_qualified_name: dict[str, Diagram] = {}
+        self._diagrams_by_name: dict[str, Diagram] = {}
+        for diagram in element_factory.select(Diagram):
+            self._diagrams_by_qualified_name.setdefault(
+                ".".join(diagram.qualifiedName), diagram
+            )
+            self._diagrams_by_name.setdefault(diagram.name, diagram)
+
+    def diagram(self, name: str) -> Diagram | None:
+        """Find a diagram by qualified name, or by name."""
+        if diagram := self._diagrams_by_qualified_name.get(name):
+            return diagram
+        return self._diagrams_by_name.get(name)
+
+
 @functools.cache
-def load_model(model_file: str) -> ElementFactory:
-    element_factory = ElementFactory()
+def load_model(model_file: Path, cache_dir: Path | None = None) -> Model:
+    session = Session.headless()
+    element_factory = session.get_service("element_factory")
+    modeling_language = session.get_service("modeling_language")
+
+    elements, gaphor_version = parse_model(model_file, cache_dir)
+    storage.check_version(gaphor_version)
+    with element_factory.block_events():
+        storage.load_elements(
+            elements, element_factory, modeling_language, gaphor_version
+        )
+    return Model(element_factory)
+
 
-    modeling_language = ModelingLanguageService()
+def parse_model(
+    model_file: Path, cache_dir: Path | None = None
+) -> tuple[dict[str, element], str]:
+    """Parse a model file.
 
-    with open(model_file, encoding="utf-8") as file_obj:
-        storage.load(
-            file_obj,
-            element_factory,
-            modeling_language,
+    If a cache directory is provided, the parsed model is cached there,
+    keyed by the content of the model file. This way parallel Sphinx
+    workers and subsequent builds do not need to parse the model again.
+    Cache files of previous versions of the model are removed.
+    """
+    content = Path(model_file).read_bytes()
+    key = hashlib.sha256(content + distribution().version.encode()).hexdigest()
+    prefix = cache_prefix(model_file)
+    cache_file = Path(cache_dir) / f"{prefix}-{key}.json" if cache_dir else None
+
+    if cache_file and cache_file.exists():
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+            return {
+                id: _element_from_json(id, type, values, references)
+                for id, (type, values, references) in data["elements"].items()
+            }, data["gaphor-version"]
+        except (OSError, ValueError, KeyError, TypeError):
+            log.warning(f"Invalid model cache {cache_file}, parsing {model_file}")
+
+    loader = GaphorLoader()
+    for _ in parse_generator(io.StringIO(content.decode("utf-8")), loader):
+        pass
+
+    if cache_file:
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}")
+        tmp_file.write_text(
+            json.dumps(
+                {
+                    "gaphor-version": loader.gaphor_version,
+                    "elements": {
+                        id: (e.type, e.values, e.references)
+                        for id, e in loader.elements.items()
+                    },
+                }
+            ),
+            encoding="utf-8",
         )
-    return element_factory
+        tmp_file.replace(cache_file)
+        for superseded in cache_file.parent.glob(f"{prefix}-*.json"):
+            if superseded != cache_file:
+                superseded.unlink(missing_ok=True)
+
+    return loader.elements, loader.gaphor_version
+
+
+def cache_prefix(model_file: Path) -> str:
+    """Cache files of a model share a prefix, based on the model's path."""
+    path_hash = hashlib.sha256(str(Path(model_file).resolve()).encode()).hexdigest()
+    return f"{Path(model_file).stem}-{path_hash[:16]}"
+
+
+def _element_from_json(id, type, values, references) -> element:
+    e = element(id, type)
+    e.values = values
+    e.references = references
+    return e
@@ -1,6 +1,8 @@
+import pytest
 import sphinx.application
 import sphinx.util.docutils
 
+from gaphor.extensions.sphinx import load_model, parse_model
 from gaphor.extensions.sphinx import setup as sphinx_setup
 
 
@@ -44,3 +46,60 @@ def test_setup_load_models(tmp_path):
     assert result["parallel_write_safe"]
 
     assert sphinx.util.docutils.is_directive_registered("diagram")
+
+
+def test_parse_model_with_cache(test_models, tmp_path):
+    model_file = test_models / "all-elements.gaphor"
+
+    elements, version = parse_model(model_file, tmp_path)
+    cached_elements, cached_version = parse_model(model_file, tmp_path)
+
+    assert list(tmp_path.glob("*.json"))
+    assert version == cached_version
+    assert elements.keys() == cached_elements.keys()
+    assert all(
+        e.type == cached_elements[id].type
+        and e.values == cached_elements[id].values
+        and e.references == cached_elements[id].references
+        for id, e in elements.items()
+    )
+
+
+def test_parse_model_removes_superseded_cache(test_models, tmp_path):
+    model_file = tmp_path / "model.gaphor"
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    model_file.write_bytes((test_models / "all-elements.gaphor").read_bytes())
+    parse_model(model_file, cache_dir)
+    (old_cache_file,) = cache_dir.glob("*.json")
+
+    model_file.write_bytes((test_models / "test-model.gaphor").read_bytes())
+    parse_model(model_file, cache_dir)
+
+    (cache_file,) = cache_dir.glob("*.json")
+    assert cache_file != old_cache_file
+
+
+OLD_MODEL = """<?xml version="1.0" encoding="utf-8"?>
+<gaphor xmlns="http://gaphor.sourceforge.net/model" version="3.0" gaphor-version="0.16.0">
+</gaphor>
+"""
+
+
+def test_load_old_model_from_cache(tmp_path):
+    model_file = tmp_path / "old.gaphor"
+    model_file.write_text(OLD_MODEL, encoding="utf-8")
+    parse_model(model_file, tmp_path)
+
+    with pytest.raises(ValueError):
+        load_model(model_file, tmp_path)
+
+
+def test_load_model_finds_diagram_by_name(test_models, tmp_path):
+    model = load_model(test_models / "all-elements.gaphor", tmp_path)
+
+    diagram = model.diagram("main")
+
+    assert diagram
+    assert model.diagram(".".join(diagram.qualifiedName)) is diagram
+    assert model.diagram("no such diagram") is None
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
 from functools import singledispatch
 from typing import Iterable, Iterator
 
@@ -27,6 +29,7 @@ from gaphor.UML import NamedElement
 from gaphor.UML.actions.activitynodes import ForkNodeItem
 
 DOT = "dot"
+FDP = "fdp"
 DPI = 72.0
 
 
@@ -37,6 +40,7 @@ class AutoLayoutService(Service, ActionProvider):
         if tools_menu:
             tools_menu.add_actions(self)
         self.dump_gv = dump_gv
+        self.layout_cache = LayoutCache()
 
     def shutdown(self):
         pass
@@ -57,41 +61,125 @@ class AutoLayoutService(Service, ActionProvider):
         if current_diagram := self.diagrams.get_current_diagram():
             self.layout(current_diagram, splines="ortho")
 
-    def layout(self, diagram: Diagram, splines="polyline"):
-        auto_layout = AutoLayout(self.event_manager, self.dump_gv)
+    @action(
+        name="auto-layout-incremental",
+        label=gettext("Auto Layout (incremental)"),
+    )
+    def layout_current_diagram_incremental(self):
+        if current_diagram := self.diagrams.get_current_diagram():
+            self.layout(current_diagram, incremental=True)
+
+    def layout(self, diagram: Diagram, splines="polyline", incremental=False):
+        auto_layout = AutoLayout(self.event_manager, self.dump_gv, self.layout_cache)
 
         with Transaction(self.event_manager):
-            auto_layout.layout(diagram, splines)
+            auto_layout.layout(diagram, splines, incremental)
+
+
+class LayoutCache:
+    """Cache for auto-layout results.
+
+    Rendered graphs are kept in a bounded LRU cache, keyed by a hash of the
+    graph sent to Graphviz. For each diagram the positions of the elements
+    as applied by the last layout are recorded, so an incremental layout
+    can tell which elements have not changed since.
+    """
+
+    def __init__(self, maxsize=16):
+        self.maxsize = maxsize
+        self._rendered: OrderedDict[str, pydot.Dot] = OrderedDict()
+        self._positions: dict[str, dict[str, Rect]] = {}
+
+    def rendered_graph(self, key: str) -> pydot.Dot | None:
+        if (rendered_graph := self._rendered.get(key)) is not None:
+            self._rendered.move_to_end(key)
+        return rendered_graph
+
+    def add_rendered_graph(self, key: str, rendered_graph: pydot.Dot) -> None:
+        self._rendered[key] = rendered_graph
+        self._rendered.move_to_end(key)
+        while len(self._rendered) > self.maxsize:
+            self._rendered.popitem(last=False)
+
+    def positions(self, diagram: Diagram) -> dict[str, Rect]:
+        return self._positions.get(diagram.id, {})
+
+    def record_positions(self, diagram: Diagram) -> None:
+        self._positions[diagram.id] = {
+            p.id: presentation_bounds(p)
+            for p in diagram.ownedPresentation
+            if isinstance(p, ElementPresentation)
+        }
 
 
 class AutoLayout:
-    def __init__(self, event_manager=None, dump_gv=False) -> None:
+    def __init__(
+        self, event_manager=None, dump_gv=False, cache: LayoutCache | None = None
+    ) -> None:
         self.event_manager = event_manager
         self.dump_gv = dump_gv
+        self.cache = cache or LayoutCache()
+
+    def layout(self, diagram: Diagram, splines="polyline", incremental=False) -> None:
+        """Lay out a diagram.
 
-    def layout(self, diagram: Diagram, splines="polyline") -> None:
+        In incremental mode, elements that did not move or change in size
+        since the previous layout keep their position. Other elements are
+        laid out around them.
+        """
         diagram.update(diagram.ownedPresentation)
         graph = diagram_as_pydot(diagram, splines=splines)
-        rendered_graph = self.render(graph)
-        self.apply_layout(diagram, rendered_graph)
+        if incremental and (pinned := self.unchanged_presentations(diagram)):
+            pin_nodes(graph, pinned)
+            rendered_graph = self.render(graph, prog=FDP)
+            # Graphviz moves the drawing to the origin: move it back, so
+            # pinned elements keep their position.
+            offset = pinned_offset(rendered_graph, pinned, graph_height(rendered_graph))
+        else:
+            rendered_graph = self.render(graph)
+            offset = (0.0, 0.0)
+        self.apply_layout(diagram, rendered_graph, offset=offset)
         diagram.update(diagram.ownedPresentation)
-
-    def render(self, graph: pydot.Dot):
+        self.cache.record_positions(diagram)
+
+    def unchanged_presentations(self, diagram: Diagram) -> dict[str, Rect]:
+        positions = self.cache.positions(diagram)
+        return {
+            id: bounds
+            for id, bounds in positions.items()
+            if (p := diagram.lookup(id))
+            and isinstance(p, ElementPresentation)
+            and presentation_bounds(p) == bounds
+        }
+
+    def render(self, graph: pydot.Dot, prog=DOT):
         if self.dump_gv:
             graph.write("auto_layout.gv")
 
-        rendered_string = graph.create(prog=DOT, format="dot", encoding="utf-8").decode(
-            "utf-8"
-        )
+        graph_string = graph.to_string()
+        key = hashlib.sha256(f"{prog}\n{graph_string}".encode()).hexdigest()
+        if (rendered_graph := self.cache.rendered_graph(key)) is not None:
+            return rendered_graph
 
-        rendered_graphs = pydot.graph_from_dot_data(rendered_string)
-        return rendered_graphs[0]
+        rendered_string = graph.create(
+            prog=prog, format="dot", encoding="utf-8"
+        ).decode("utf-8")
+
+        rendered_graph = pydot.graph_from_dot_data(rendered_string)[0]
+        self.cache.add_rendered_graph(key, rendered_graph)
+        return rendered_graph
 
     def apply_layout(  # noqa: C901
-        self, diagram, rendered_graph, parent_presentation=None, height=None
+        self,
+        diagram,
+        rendered_graph,
+        parent_presentation=None,
+        height=None,
+        offset: Point = (0.0, 0.0),
     ):
         if height is None:
-            _, _, _, height = parse_bb(rendered_graph.get_node("graph")[0].get("bb"))
+            height = graph_height(rendered_graph)
+        dx, dy = offset
 
         matrix_c2i = (
             parent_presentation.matrix_i2c.inverse()
@@ -125,7 +213,7 @@ class AutoLayout:
                     presentation.width = w
                     presentation.height = h
 
-                    new_pos = matrix_c2i.transform_point(x, y)
+                    new_pos = matrix_c2i.transform_point(x - dx, y - dy)
                     presentation.matrix.set(
                         x0=new_pos[0],
                         y0=new_pos[1],
@@ -135,6 +223,7 @@ class AutoLayout:
                         subgraph,
                         parent_presentation=presentation,
                         height=height,
+                        offset=offset,
                     )
 
         for node in rendered_graph.get_nodes():
@@ -142,7 +231,8 @@ class AutoLayout:
                 continue
 
             if presentation := presentation_for_object(diagram, node):
-                center = parse_point(node.get_pos(), height)
+                cx, cy = parse_point(node.get_pos(), height)
+                center = (cx - dx, cy - dy)
                 if isinstance(presentation, ElementPresentation):
                     # Normalize handle placement
                     w = presentation.width
@@ -179,8 +269,8 @@ class AutoLayout:
                 assert len(points) == len(presentation.handles())
 
                 matrix = presentation.matrix_i2c.inverse()
-                for handle, point in zip(presentation.handles(), points):
-                    handle.pos = matrix.transform_point(*point)
+                for handle, (x, y) in zip(presentation.handles(), points):
+                    handle.pos = matrix.transform_point(x - dx, y - dy)
 
                 for handle in (presentation.head, presentation.tail):
                     reconnect(presentation, handle, diagram.connections)
@@ -194,8 +284,62 @@ def presentation_for_object(diagram, obj) -> Presentation | None:
     if not obj.get("id"):
         return None
 
-    id = strip_quotes(obj.get("id"))
-    return next((p for p in diagram.ownedPresentation if p.id == id), None)
+    return diagram.lookup(strip_quotes(obj.get("id")))
+
+
+def presentation_bounds(presentation: ElementPresentation) -> Rect:
+    x, y = presentation.matrix_i2c.transform_point(0, 0)
+    return (
+        round(x, 2),
+        round(y, 2),
+        round(presentation.width, 2),
+        round(presentation.height, 2),
+    )
+
+
+def pin_nodes(graph: pydot.Graph, pinned: dict[str, Rect]) -> None:
+    """Fix the position of nodes, for an incremental layout.
+
+    Positions are in points (``inputscale``). Graphviz' y-axis points
+    upwards, hence y coordinates are negated.
+    """
+    if isinstance(graph, pydot.Dot):
+        graph.set("inputscale", DPI)
+
+    for node in graph.get_nodes():
+        if (id := node.get("id")) and (bounds := pinned.get(strip_quotes(id))):
+            x, y, w, h = bounds
+            node.set("pos", f'"{x + w / 2},{-(y + h / 2)}!"')
+
+    for subgraph in graph.get_subgraphs():
+        pin_nodes(subgraph, pinned)
+
+
+def pinned_offset(
+    rendered_graph: pydot.Graph, pinned: dict[str, Rect], height: float
+) -> Point:
+    """The offset between the requested and the rendered position of pinned
+    nodes."""
+    for node in rendered_graph.get_nodes():
+        if (
+            (id := node.get("id"))
+            and (bounds := pinned.get(strip_quotes(id)))
+            and node.get_pos()
+        ):
+            x, y, w, h = bounds
+            cx, cy = parse_point(node.get_pos(), height)
+            return cx - (x + w / 2), cy - (y + h / 2)
+
+    for subgraph in rendered_graph.get_subgraphs():
+        if (offset := pinned_offset(subgraph, pinned, height)) != (0.0, 0.0):
+            return offset
+
+    return (0.0, 0.0)
+
+
+def graph_height(rendered_graph: pydot.Graph) -> float:
+    _, _, _, height = parse_bb(rendered_graph.get_node("graph")[0].get("bb"))
+    return height
 
 
 def reconnect(presentation, handle, connections) -> None:
@@ -361,7 +505,8 @@ def parse_edge_pos(pos_str: str, height: float) -> list[Point]:
 
 
 def parse_point(point, height) -> Point:
-    x, y = strip_quotes(point).split(",")
+    # Pinned nodes are marked with an exclamation mark
+    x, y = strip_quotes(point).rstrip("!").split(",")
     return (float(x), height - float(y))
 
 
@@ -1,9 +1,17 @@
+import pydot
 import pytest
 
 from gaphor import UML
 from gaphor.core.modeling import Comment
 from gaphor.diagram.tests.fixtures import connect
-from gaphor.plugins.autolayout.pydot import AutoLayout, parse_edge_pos, strip_quotes
+from gaphor.plugins.autolayout.pydot import (
+    AutoLayout,
+    LayoutCache,
+    parse_edge_pos,
+    pin_nodes,
+    pinned_offset,
+    strip_quotes,
+)
 from gaphor.UML.diagramitems import (
     ActionItem,
     AssociationItem,
@@ -98,6 +106,71 @@ def test_layout_fork_node_item(diagram, create, event_manager):
     auto_layout.layout(diagram)
 
 
+def test_layout_is_cached(diagram, create, event_manager, monkeypatch):
+    superclass = create(ClassItem, UML.Class)
+    subclass = create(ClassItem, UML.Class)
+    gen = create(GeneralizationItem, UML.Generalization)
+    connect(gen, gen.tail, superclass)
+    connect(gen, gen.head, subclass)
+    cache = LayoutCache()
+
+    AutoLayout(event_manager, cache=cache).layout(diagram)
+    monkeypatch.setattr(pydot.Dot, "create", None)
+    AutoLayout(event_manager, cache=cache).layout(diagram)
+
+    assert gen.head.pos != (0, 0)
+
+
+def test_layout_cache_is_bounded():
+    cache = LayoutCache(maxsize=2)
+
+    for key in "abc":
+        cache.add_rendered_graph(key, pydot.Dot())
+
+    assert cache.rendered_graph("a") is None
+    assert cache.rendered_graph("b")
+    assert cache.rendered_graph("c")
+
+
+def test_incremental_layout(diagram, create, event_manager):
+    c1 = create(ClassItem, UML.Class)
+    c2 = create(ClassItem, UML.Class)
+    a = create(AssociationItem)
+    connect(a, a.head, c1)
+    connect(a, a.tail, c2)
+    auto_layout = AutoLayout(event_manager)
+    auto_layout.layout(diagram)
+    c1_pos = c1.matrix[4], c1.matrix[5]
+    c2_pos = c2.matrix[4], c2.matrix[5]
+
+    create(ClassItem, UML.Class)
+    auto_layout.layout(diagram, incremental=True)
+
+    assert (c1.matrix[4], c1.matrix[5]) == pytest.approx(c1_pos, abs=1)
+    assert (c2.matrix[4], c2.matrix[5]) == pytest.approx(c2_pos, abs=1)
+
+
+def test_pin_nodes():
+    graph = pydot.Dot()
+    graph.add_node(pydot.Node('"a"', id="a"))
+    graph.add_node(pydot.Node('"b"', id="b"))
+
+    pin_nodes(graph, {"a": (10.0, 20.0, 100.0, 50.0)})
+
+    assert graph.get("inputscale") == 72.0
+    assert graph.get_node('"a"')[0].get("pos") == '"60.0,-45.0!"'
+    assert graph.get_node('"b"')[0].get("pos") is None
+
+
+def test_pinned_offset():
+    graph = pydot.Dot()
+    graph.add_node(pydot.Node('"a"', id="a", pos='"70.0,55.0!"'))
+
+    offset = pinned_offset(graph, {"a": (10.0, 20.0, 100.0, 50.0)}, height=100.0)
+
+    assert offset == (10.0, 0.0)
+
+
 def test_parse_pos():
     points = parse_edge_pos('"1.0,2.0 3.0,4 5.0,6.0 7,8.0"', 10)
 
@@ -7,6 +7,8 @@ from gi.repository import Adw, Gdk, Gtk
 from gaphor import settings
 from gaphor.abc import ActionProvider
 from gaphor.action import action
+from gaphor.core.modeling import Diagram
+from gaphor.core.modeling.instrumentation import log_update_stats
 from gaphor.i18n import gettext
 from gaphor.plugins.console.console import GTKInterpreterConsole
 from gaphor.ui.abc import UIComponent
@@ -62,6 +64,7 @@ class ConsoleWindow(UIComponent, ActionProvider):
             locals={
                 "service": self.component_registry.get_service,
                 "select": element_factory.lselect,
+                "instrument": instrument_diagrams(element_factory),
             }
         )
         box = Gtk.Box(orientation="vertical")
@@ -81,3 +84,26 @@ class ConsoleWindow(UIComponent, ActionProvider):
         console.text_controller.connect("key-pressed", key_event)
 
         return console
+
+
+def instrument_diagrams(element_factory):
+    def instrument(diagram=None, handler=log_update_stats):
+        """Report the cost of diagram updates.
+
+        Instrument ``diagram``, or all diagrams in the model if no diagram is
+        provided. By default update statistics are logged. A handler is only
+        added once to a diagram.
+
+        Returns a function that removes the handler again.
+        """
+        diagrams = [diagram] if diagram else element_factory.lselect(Diagram)
+        for d in diagrams:
+            d.add_update_handler(handler)
+
+        def uninstrument():
+            for d in diagrams:
+                d.remove_update_handler(handler)
+
+        return uninstrument
+
+    return instrument
@@ -3,8 +3,8 @@ from gi.repository import GLib, Gtk
 
 import gaphor.services.componentregistry
 import gaphor.ui.menufragment
-from gaphor.core.modeling import ElementFactory
-from gaphor.plugins.console.consolewindow import ConsoleWindow
+from gaphor.core.modeling import Diagram, ElementFactory
+from gaphor.plugins.console.consolewindow import ConsoleWindow, instrument_diagrams
 
 
 class MainWindowStub:
@@ -48,3 +48,21 @@ def test_open_close(component_registry, main_window, tools_menu):
     app.run()
 
     assert tools_menu.menu.get_n_items() == 1
+
+
+def test_instrument_diagrams_once():
+    element_factory = ElementFactory()
+    diagram = element_factory.create(Diagram)
+    instrument = instrument_diagrams(element_factory)
+    reports = []
+
+    def handler(diagram, stats):
+        reports.append(stats)
+
+    instrument(handler=handler)
+    uninstrument = instrument(handler=handler)
+    diagram.update()
+    uninstrument()
+    diagram.update()
+
+    assert len(reports) == 1
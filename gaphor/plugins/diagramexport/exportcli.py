@@ -6,11 +6,6 @@ import re
 from pathlib import Path
 from typing import List
 
-from gaphor.application import Session
-from gaphor.core.modeling import Diagram
-from gaphor.diagram.export import escape_filename, save_pdf, save_png, save_svg
-from gaphor.storage import storage
-
 log = logging.getLogger(__name__)
 
 
@@ -40,8 +35,8 @@ def export_parser():
         "-f",
         "--format",
         metavar="format",
-        help="output file format, default pdf",
-        default="pdf",
+        help="output file format, default pdf; can be provided multiple times",
+        action="append",
         choices=["pdf", "svg", "png"],
     )
     parser.add_argument(
@@ -52,6 +47,13 @@ def export_parser():
         help="process diagrams which name matches given regular expression;"
         " name includes package name; regular expressions are case insensitive",
     )
+    parser.add_argument(
+        "--force",
+        dest="force",
+        action="store_true",
+        help="render all diagrams, including the ones that did not change"
+        " since the last export",
+    )
     parser.add_argument("model", nargs="+")
     parser.set_defaults(command=export_command)
 
@@ -59,19 +61,24 @@ def export_parser():
 
 
 def export_command(args):
-    session = Session(
-        services=[
-            "event_manager",
-            "component_registry",
-            "element_factory",
-            "element_dispatcher",
-            "modeling_language",
-        ]
+    # Only now import the modules needed for exporting
+    from gaphor.application import Session, distribution
+    from gaphor.core.modeling import Diagram
+    from gaphor.diagram.export import (
+        ExportManifest,
+        diagram_fingerprint,
+        escape_filename,
+        render_many,
     )
+    from gaphor.storage import storage
+
+    session = Session.headless()
     factory = session.get_service("element_factory")
     modeling_language = session.get_service("modeling_language")
 
     name_re = re.compile(args.regex, re.IGNORECASE) if args.regex else None
+    formats = args.format or ["pdf"]
+    manifest = ExportManifest(args.dir or ".", distribution().version)
     # we should have some gaphor files to be processed at this point
     for model in args.model:
         log.debug("loading model %s", model)
@@ -98,19 +105,26 @@ def export_command(args):
             if args.dir:
                 odir = f"{args.dir}/{odir}"
 
-            outfilename = f"{odir}/{dname}.{args.format}"
+            fingerprint = diagram_fingerprint(diagram)
+            outfiles = {}
+            for format in formats:
+                outfilename = f"{odir}/{dname}.{format}"
+                if args.force or not manifest.up_to_date(outfilename, fingerprint):
+                    outfiles[format] = outfilename
+
+            if not outfiles:
+                log.debug("unchanged, skipping %s", pname)
+                continue
 
             if not Path(odir).exists():
                 log.debug("creating dir %s", odir)
                 Path(odir).mkdir(parents=True)
 
-            log.debug("rendering: %s -> %s...", pname, outfilename)
+            log.debug("rendering: %s -> %s...", pname, ", ".join(outfiles.values()))
+
+            render_many(diagram, outfiles)
+
+            for outfilename in outfiles.values():
+                manifest.update(outfilename, fingerprint)
 
-            if args.format == "pdf":
-                save_pdf(outfilename, diagram)
-            elif args.format == "svg":
-                save_svg(outfilename, diagram)
-            elif args.format == "png":
-                save_png(outfilename, diagram)
-            else:
-                raise RuntimeError(f"Unknown file format: {args.format}")
+    manifest.save()
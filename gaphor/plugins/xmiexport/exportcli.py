@@ -0,0 +1,58 @@
+import argparse
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+
+def xmi_export_parser():
+    parser = argparse.ArgumentParser(description="Export Gaphor models as XMI.")
+
+    parser.add_argument(
+        "-o", "--dir", metavar="directory", help="output to directory", default="."
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        metavar="jobs",
+        type=int,
+        help="number of models to export in parallel, default the number of CPUs",
+    )
+    parser.add_argument("model", nargs="+")
+    parser.set_defaults(command=xmi_export_command)
+
+    return parser
+
+
+def xmi_export_command(args):
+    outdir = Path(args.dir)
+    outdir.mkdir(parents=True, exist_ok=True)
+    outfiles = [outdir / Path(model).with_suffix(".xmi").name for model in args.model]
+
+    if len(args.model) == 1 or args.jobs == 1:
+        for model, outfile in zip(args.model, outfiles):
+            export_model(model, outfile)
+    else:
+        with ProcessPoolExecutor(args.jobs) as executor:
+            list(executor.map(export_model, args.model, outfiles))
+    return 0
+
+
+def export_model(model, outfile):
+    # Only now import the modules needed for exporting
+    from gaphor.application import Session
+    from gaphor.plugins.xmiexport.exportmodel import XMIExport
+    from gaphor.storage import storage
+
+    session = Session.headless()
+    element_factory = session.get_service("element_factory")
+    modeling_language = session.get_service("modeling_language")
+
+    log.debug("loading model %s", model)
+    with open(model, encoding="utf-8") as file_obj:
+        storage.load(file_obj, element_factory, modeling_language)
+
+    log.debug("exporting %s -> %s", model, outfile)
+    XMIExport(element_factory).export(outfile)
+    session.shutdown()
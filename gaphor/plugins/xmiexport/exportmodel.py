@@ -1,5 +1,6 @@
 import logging
 
+from gaphor import UML
 from gaphor.storage.xmlwriter import XMLWriter
 
 logger = logging.getLogger(__name__)
@@ -11,10 +12,11 @@ class XMIExport:
     UML_NAMESPACE = "http://schema.omg.org/spec/UML/2.1"
     XMI_PREFIX = "XMI"
     UML_PREFIX = "UML"
+    BUFFER_SIZE = 1 << 16
 
     def __init__(self, element_factory):
         self.element_factory = element_factory
-        self.handled_ids = []
+        self.handled_ids = set()
 
     def handle(self, xmi, element):
         logger.debug(f"Handling {element.__class__.__name__}")
@@ -24,7 +26,7 @@ class XMIExport:
             idref = element.id in self.handled_ids
             handler(xmi, element, idref=idref)
             if not idref:
-                self.handled_ids.append(element.id)
+                self.handled_ids.add(element.id)
         except AttributeError as e:
             logger.warning(f"Missing handler for {element.__class__.__name__}:{e}")
         except Exception as e:
@@ -210,37 +212,35 @@ class XMIExport:
         pass
 
     def export(self, filename):
-        with open(filename, "w", encoding="utf-8") as out:
-            xmi = XMLWriter(out)
+        with open(filename, "w", encoding="utf-8", buffering=self.BUFFER_SIZE) as out:
+            self.write(out)
 
-            attributes = {
-                "xmi.version": self.XMI_VERSION,
-                "xmlns:xmi": self.XMI_NAMESPACE,
-                "xmlns:UML": self.UML_NAMESPACE,
-            }
+    def write(self, out):
+        """Write the model as XMI to a file-like object."""
+        xmi = XMLWriter(out)
 
-            xmi.startElement("XMI", attrs=attributes)
-
-            for package in self.element_factory.select(self.select_package):
-                self.handle(xmi, package)
-
-            for generalization in self.element_factory.select(
-                self.select_generalization
-            ):
-                self.handle(xmi, generalization)
-
-            for realization in self.element_factory.select(self.select_realization):
-                self.handle(xmi, realization)
+        attributes = {
+            "xmi.version": self.XMI_VERSION,
+            "xmlns:xmi": self.XMI_NAMESPACE,
+            "xmlns:UML": self.UML_NAMESPACE,
+        }
 
-            xmi.endElement("XMI")
+        xmi.startElement("XMI", attrs=attributes)
 
-            logger.debug(self.handled_ids)
+        # Collect top level elements in one pass, in export order
+        toplevel: dict[type, list] = {
+            UML.Package: [],
+            UML.Generalization: [],
+            UML.InterfaceRealization: [],
+        }
+        for element in self.element_factory.select():
+            if (elements := toplevel.get(type(element))) is not None:
+                elements.append(element)
 
-    def select_package(self, element):
-        return element.__class__.__name__ == "Package"
+        for elements in toplevel.values():
+            for element in elements:
+                self.handle(xmi, element)
 
-    def select_generalization(self, element):
-        return element.__class__.__name__ == "Generalization"
+        xmi.endElement("XMI")
 
-    def select_realization(self, element):
-        return element.__class__.__name__ == "InterfaceRealization"
+        logger.debug(self.handled_ids)
@@ -1,3 +1,5 @@
+import io
+
 import pytest
 
 from gaphor import UML
@@ -36,3 +38,13 @@ def test_xmi_export(element_factory, tmp_path):
     content = f.read_text(encoding="utf-8")
 
     assert '<XMI xmi.version="2.1"' in content
+
+
+def test_xmi_export_handles_toplevel_elements(element_factory):
+    exporter = XMIExport(element_factory)
+    out = io.StringIO()
+
+    exporter.write(out)
+
+    content = out.getvalue()
+    assert content.index("<UML:Package") < content.index("<UML:Generalization")
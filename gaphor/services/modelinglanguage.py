@@ -1,9 +1,9 @@
-from typing import Dict, Iterable
+from typing import Iterable
 
 from gaphor.abc import ActionProvider, ModelingLanguage, Service
 from gaphor.action import action
 from gaphor.core import event_handler
-from gaphor.entrypoint import initialize
+from gaphor.entrypoint import LazyEntryPoints
 from gaphor.services.properties import PropertyChanged
 
 
@@ -17,7 +17,8 @@ class ModelingLanguageService(Service, ActionProvider, ModelingLanguage):
 
     def __init__(self, event_manager=None, properties=None):
         """Create a new Model Provider. It will provide all models defined as
-        entrypoints under `[gaphor.modelinglanguages]`.
+        entrypoints under `[gaphor.modelinglanguages]`. Modeling languages
+        are loaded when they are first needed.
 
         The `properties` argument is optional, in which case the service
         will default to UML.
@@ -27,7 +28,7 @@ class ModelingLanguageService(Service, ActionProvider, ModelingLanguage):
         self.event_manager = event_manager
         self.properties = properties
 
-        self._modeling_languages: Dict[str, ModelingLanguage] = initialize(
+        self._modeling_languages: LazyEntryPoints[ModelingLanguage] = LazyEntryPoints(
             "gaphor.modelinglanguages"
         )
         if event_manager:
@@ -72,16 +73,11 @@ class ModelingLanguageService(Service, ActionProvider, ModelingLanguage):
         return self._modeling_language().element_types
 
     def lookup_element(self, name):
-        return next(
-            filter(
-                None,
-                [
-                    provider.lookup_element(name)
-                    for provider in self._modeling_languages.values()
-                ],
-            ),
-            None,
-        )
+        # Modeling languages are loaded in order, until the element is found
+        for provider in self._modeling_languages.values():
+            if element_type := provider.lookup_element(name):
+                return element_type
+        return None
 
     @action(name="select-modeling-language")
     def select_modeling_language(self, modeling_language: str):
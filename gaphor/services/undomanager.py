@@ -346,10 +346,11 @@ class UndoManager(Service, ActionProvider):
                 except ValueError:
                     diagram = self.element_factory.create_as(Diagram, diagram_id)
 
-                element = diagram.create_as(element_type, element_id)
-                for name, ser in data.items():
-                    for value in deserialize(ser, lambda ref: None):
-                        element.load(name, value)
+                with diagram.bulk_create():
+                    element = diagram.create_as(element_type, element_id)
+                    for name, ser in data.items():
+                        for value in deserialize(ser, lambda ref: None):
+                            element.load(name, value)
 
         else:
 
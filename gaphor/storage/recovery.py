@@ -2,6 +2,7 @@ import ast
 import hashlib
 import logging
 from collections.abc import Iterator
+from contextlib import ExitStack
 from io import IOBase
 from pathlib import Path
 
@@ -445,9 +446,27 @@ class Recorder:
         )
 
 
+def bulk_create_diagrams(events, element_factory):
+    """Enter ``Diagram.bulk_create()`` for each diagram presentations are
+    created in.
+
+    The diagrams are updated once, when all events have been consumed.
+    """
+    with ExitStack() as bulk_create:
+        diagrams = set()
+        for event in events:
+            match event:
+                case ("c", _type, _element_id, diagram_id) if diagram_id:
+                    diagram = element_factory.lookup(diagram_id)
+                    if diagram not in diagrams:
+                        bulk_create.enter_context(diagram.bulk_create())
+                        diagrams.add(diagram)
+            yield event
+
+
 def replay_events(events, element_factory, modeling_language):
     """Replay events previously recorded by EventLog."""
-    for event in events:
+    for event in bulk_create_diagrams(events, element_factory):
         match event:
             case ("c", type, element_id, None):
                 element_factory.create_as(
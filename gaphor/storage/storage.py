@@ -299,10 +299,7 @@ def load_generator(
     elements = loader.elements
     gaphor_version = loader.gaphor_version
 
-    if version_lower_than(gaphor_version, (0, 17, 0)):
-        raise ValueError(
-            f"Gaphor model version should be at least 0.17.0 (found {gaphor_version})"
-        )
+    check_version(gaphor_version)
 
     log.info(f"Read {len(elements)} elements from file")
 
@@ -319,6 +316,14 @@ def load_generator(
     yield 100
 
 
+def check_version(gaphor_version: str) -> None:
+    """Raise a ``ValueError`` if a model is too old to be loaded."""
+    if version_lower_than(gaphor_version, (0, 17, 0)):
+        raise ValueError(
+            f"Gaphor model version should be at least 0.17.0 (found {gaphor_version})"
+        )
+
+
 def version_lower_than(gaphor_version, version):
     """Only major and minor versions are checked.
 
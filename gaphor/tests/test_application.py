@@ -2,8 +2,15 @@ from pathlib import Path
 
 import pytest
 
-from gaphor.application import Application
+from gaphor.application import Application, Session
+from gaphor.core.modeling import Diagram
+from gaphor.core.modeling.modelinglanguage import (
+    CoreModelingLanguage,
+    MockModelingLanguage,
+)
 from gaphor.event import ModelSaved, SessionCreated
+from gaphor.services.componentregistry import ComponentLookupError
+from gaphor.storage import storage
 
 
 @pytest.fixture
@@ -48,3 +55,25 @@ def test_new_session_from_template(application, test_models):
         session = application.new_session(template=model)
 
     assert any(session.get_service("element_factory").select())
+
+
+def test_headless_session(test_models):
+    session = Session.headless()
+    element_factory = session.get_service("element_factory")
+    with (test_models / "test-model.gaphor").open(encoding="utf-8") as model:
+        storage.load(model, element_factory, session.get_service("modeling_language"))
+
+    assert any(element_factory.select(Diagram))
+    with pytest.raises(ComponentLookupError):
+        session.get_service("undo_manager")
+
+    session.shutdown()
+
+
+def test_headless_session_with_known_service():
+    modeling_language = MockModelingLanguage(CoreModelingLanguage())
+    session = Session.headless(modeling_language=modeling_language)
+
+    assert session.get_service("modeling_language") is modeling_language
+
+    session.shutdown()
@@ -48,3 +48,13 @@ def test_load_multi_dependent_service():
     assert isinstance(initialized["service_c"], ServiceC)
     assert initialized["service_a"] is initialized["service_c"].service_a
     assert initialized["service_b"] is initialized["service_c"].service_b
+
+
+def test_known_service_is_not_replaced():
+    service_a = ServiceA()
+    uninitialized_services = {"service_a": ServiceA, "service_b": ServiceB}
+
+    initialized = init_entry_points(uninitialized_services, service_a=service_a)
+
+    assert initialized["service_a"] is service_a
+    assert initialized["service_b"].service_a is service_a
@@ -20,7 +20,11 @@ from gaphor.core.modeling.event import (
 )
 from gaphor.core.styling import StyleNode
 from gaphor.diagram.event import DiagramSelectionChanged
-from gaphor.diagram.propertypages import PropertyPages, new_resource_builder
+from gaphor.diagram.propertypages import (
+    PropertyPageBase,
+    PropertyPages,
+    new_resource_builder,
+)
 from gaphor.i18n import gettext, localedir
 from gaphor.ui.abc import UIComponent
 from gaphor.ui.csscompletion import (
@@ -151,6 +155,11 @@ class ElementEditor(UIComponent, ActionProvider):
         self.properties.set("remove-unused-elements", active)
 
 
+def supports_rebind(page: PropertyPageBase) -> bool:
+    """Only pages that implement ``rebind()`` are kept for reuse."""
+    return type(page).rebind is not PropertyPageBase.rebind
+
+
 class EditorStack:
     def __init__(self, event_manager, diagrams, properties):
         self.event_manager = event_manager
@@ -159,6 +168,7 @@ class EditorStack:
 
         self.vbox: Optional[Gtk.Box] = None
         self._current_item = None
+        self._page_pool: dict[type, tuple[PropertyPageBase, Gtk.Widget]] = {}
 
     def open(self, builder):
         """Display the ElementEditor pane."""
@@ -178,6 +188,7 @@ class EditorStack:
 
         self.vbox = None
         self._current_item = None
+        self._page_pool.clear()
 
     def _get_adapters(self, item):
         """Return an ordered list of (order, name, adapter)."""
@@ -197,15 +208,33 @@ class EditorStack:
 
         for (_, name), adapter in adapters:
             try:
-                page = adapter.construct()
+                page = self._reuse_page(adapter)
                 if not page:
-                    continue
+                    page = adapter.construct()
+                    if not page:
+                        continue
+                    if supports_rebind(adapter):
+                        self._page_pool[type(adapter)] = (adapter, page)
                 self.vbox.append(page)
             except Exception:
                 log.error(
                     "Could not construct property page for %s", name, exc_info=True
                 )
 
+    def _reuse_page(self, adapter):
+        """Return the widget of a pooled page of the same class, rebound to
+        the subject of ``adapter``, if possible."""
+        pooled = self._page_pool.get(type(adapter))
+        if not pooled:
+            return None
+        pooled_adapter, page = pooled
+        if page.get_parent() is not None:
+            return None
+        if pooled_adapter.rebind(adapter):
+            return page
+        del self._page_pool[type(adapter)]
+        return None
+
     def clear_pages(self):
         """Remove all tabs from the notebook."""
         assert self.vbox
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from gi.repository import Gdk, Gio, GLib, GObject, Gtk
 
 from gaphor import UML
@@ -36,10 +38,12 @@ from gaphor.ui.treemodel import (
     RelationshipItem,
     TreeItem,
     TreeModel,
+    tree_depth,
     tree_item_sort,
+    tree_owner,
     visible,
 )
-from gaphor.ui.treesearch import search, sorted_tree_walker
+from gaphor.ui.treesearch import SearchIndex
 
 START_EDIT_DELAY = 100  # ms
 
@@ -50,8 +54,11 @@ class ModelBrowser(UIComponent, ActionProvider):
         self.element_factory = element_factory
         self.modeling_language = modeling_language
         self.model = TreeModel()
+        self.search_index = SearchIndex(element_factory)
         self.search_bar = None
         self._selection_changed_id = 0
+        self._resort_elements: set[Element] = set()
+        self._resort_id = 0
 
     def open(self):
         self.event_manager.subscribe(self.on_element_created)
@@ -62,7 +69,7 @@ class ModelBrowser(UIComponent, ActionProvider):
         self.event_manager.subscribe(self.on_model_ready)
         self.event_manager.subscribe(self.on_diagram_selection_changed)
 
-        tree_model = Gtk.TreeListModel.new(
+        tree_model = self.tree_model = Gtk.TreeListModel.new(
             self.model.root,
             passthrough=False,
             autoexpand=False,
@@ -114,7 +121,9 @@ class ModelBrowser(UIComponent, ActionProvider):
             )
         )
 
-        self.search_bar = create_search_bar(SearchEngine(self.model, self.tree_view))
+        self.search_bar = create_search_bar(
+            SearchEngine(self.search_index, self.tree_view)
+        )
 
         self.search_bar.set_key_capture_widget(self.tree_view)
 
@@ -134,6 +143,9 @@ class ModelBrowser(UIComponent, ActionProvider):
         self.event_manager.unsubscribe(self.on_attribute_changed)
         self.event_manager.unsubscribe(self.on_model_ready)
         self.event_manager.unsubscribe(self.on_diagram_selection_changed)
+        if self._resort_id:
+            GLib.source_remove(self._resort_id)
+            self._resort_id = 0
 
     def select_element(self, element: Element) -> int | None:
         return select_element(self.tree_view, element)
@@ -257,16 +269,21 @@ class ModelBrowser(UIComponent, ActionProvider):
     @event_handler(ElementCreated)
     def on_element_created(self, event: ElementCreated):
         self.model.add_element(event.element)
+        self.search_index.add(event.element)
 
     @event_handler(ElementDeleted)
     def on_element_deleted(self, event: ElementDeleted):
         self.model.remove_element(event.element)
+        self.search_index.remove(event.element)
 
     @event_handler(DerivedAdded, DerivedDeleted)
     def on_owned_element_changed(self, event):
         """Ensure we update the node once owned elements change."""
         if event.property in (Element.ownedElement, UML.Namespace.member):
             self.model.notify_child_model(event.element)
+            self.search_index.owner_changed(
+                event.new_value if isinstance(event, DerivedAdded) else event.old_value
+            )
 
     @event_handler(DerivedSet)
     def on_owner_changed(self, event: DerivedSet):
@@ -279,22 +296,63 @@ class ModelBrowser(UIComponent, ActionProvider):
         element = event.element
         self.model.remove_element(element, former_owner=event.old_value)
         self.model.add_element(element)
+        self.search_index.owner_changed(element)
         self.select_element_quietly(element)
 
     @event_handler(ElementUpdated)
     def on_attribute_changed(self, event: ElementUpdated):
-        self.model.sync(event.element)
-        self.sorter.changed(Gtk.SorterChange.DIFFERENT)
+        self.search_index.update(event.element)
+        if self.model.sync(event.element):
+            self._resort_elements.add(event.element)
+            if not self._resort_id:
+                self._resort_id = GLib.idle_add(self._resort)
+
+    def _resort(self):
+        """Move renamed elements to their new position.
+
+        Changes are collected and handled at once, when idle.
+        """
+        self._resort_id = 0
+        elements, self._resort_elements = self._resort_elements, set()
+        # Moved rows are collapsed, so expand them again afterwards
+        expanded = {e for element in elements for e in self._expanded(element)}
+        self.model.reposition(elements)
+        for element in sorted(expanded, key=tree_depth):
+            if row := self._tree_list_row(element):
+                row.set_expanded(True)
+        return GLib.SOURCE_REMOVE
+
+    def _tree_list_row(self, element: Element) -> Gtk.TreeListRow | None:
+        if not (
+            (branch := self.model.owner_branch_for_element(element))
+            and (tree_item := branch.tree_item_for_element(element))
+        ):
+            return None
+        found, index = branch.elements.find(tree_item)
+        if not found:
+            return None
+        if (owner := tree_owner(element)) is None:
+            return self.tree_model.get_child_row(index)  # type: ignore[no-any-return]
+        owner_row = self._tree_list_row(owner)
+        return owner_row.get_child_row(index) if owner_row else None
+
+    def _expanded(self, element: Element) -> Iterable[Element]:
+        """The element and its descendants that are expanded in the tree."""
+
+        def expanded_rows(row):
+            if not (row and row.get_expanded()):
+                return
+            if row_element := row.get_item().element:
+                yield row_element
+            for index in range(row.get_children().get_n_items()):
+                yield from expanded_rows(row.get_child_row(index))
+
+        return expanded_rows(self._tree_list_row(element))
 
     @event_handler(ModelReady, ModelFlushed)
     def on_model_ready(self, event=None):
-        model = self.model
-        model.clear()
-
-        for element in self.element_factory.select(
-            lambda e: (e.owner is None) and visible(e)
-        ):
-            model.add_element(element)
+        self.model.populate(self.element_factory.select(lambda e: e.owner is None))
+        self.search_index.clear()
 
     @event_handler(DiagramSelectionChanged)
     def on_diagram_selection_changed(self, event):
@@ -305,34 +363,25 @@ class ModelBrowser(UIComponent, ActionProvider):
 
 
 class SearchEngine:
-    def __init__(self, model, tree_view):
-        self.model = model
+    def __init__(self, search_index, tree_view):
+        self.search_index = search_index
         self.tree_view = tree_view
         self.selection = self.tree_view.get_model()
 
     def text_changed(self, search_text):
-        selected_item = get_first_selected_item(self.selection)
-        if next_item := search(
-            search_text,
-            sorted_tree_walker(
-                self.model,
-                start_tree_item=selected_item and selected_item.get_item(),
-                from_current=True,
-            ),
-        ):
-            select_element(self.tree_view, next_item.element)
+        self._search(search_text, from_current=True)
 
     def search_next(self, search_text):
+        self._search(search_text, from_current=False)
+
+    def _search(self, search_text, from_current):
         selected_item = get_first_selected_item(self.selection)
-        if next_item := search(
+        if element := self.search_index.search(
             search_text,
-            sorted_tree_walker(
-                self.model,
-                start_tree_item=selected_item and selected_item.get_item(),
-                from_current=False,
-            ),
+            start_element=selected_item and selected_item.get_item().element,
+            from_current=from_current,
         ):
-            select_element(self.tree_view, next_item.element)
+            select_element(self.tree_view, element)
 
 
 def get_selected_elements(selection: Gtk.SelectionModel) -> list[Element]:
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from contextlib import ExitStack
+
 from gaphas.decorators import nonrecursive
 from gi.repository import Gio, Gtk
 
 from gaphor.core import event_handler
 from gaphor.core.changeset.apply import applicable, apply_change
-from gaphor.core.modeling import ModelReady, PendingChange
+from gaphor.core.modeling import ElementChange, ModelReady, PendingChange
 from gaphor.event import (
     TransactionBegin,
     TransactionCommit,
@@ -75,8 +77,19 @@ class ModelMerge:
                 for n in node.children:
                     do_apply(n)
 
+        def changed_diagrams(node):
+            for element in node.elements:
+                if isinstance(element, ElementChange) and element.diagram_id:
+                    if diagram := self.element_factory.lookup(element.diagram_id):
+                        yield diagram
+            if node.children:
+                for n in node.children:
+                    yield from changed_diagrams(n)
+
         if change_node:
-            with Transaction(self.event_manager):
+            with Transaction(self.event_manager), ExitStack() as bulk_create:
+                for diagram in set(changed_diagrams(change_node)):
+                    bulk_create.enter_context(diagram.bulk_create())
                 do_apply(change_node)
 
         for item in self.model:
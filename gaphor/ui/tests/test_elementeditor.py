@@ -6,7 +6,7 @@ import gaphor.UML.classes.classespropertypages  # noqa
 from gaphor import UML
 from gaphor.core.modeling.diagram import StyledItem
 from gaphor.diagram.tests.fixtures import find
-from gaphor.ui.elementeditor import ElementEditor, dump_css_tree
+from gaphor.ui.elementeditor import ElementEditor, dump_css_tree, supports_rebind
 from gaphor.UML.diagramitems import ClassItem, PackageItem
 
 
@@ -76,3 +76,44 @@ def test_dump_css_tree(element_factory, create):
          ╰╴compartment
             ╰╴operation"""
     )
+
+
+def test_reuse_pages(
+    event_manager, element_factory, modeling_language, diagrams, create
+):
+    properties = DummyProperties()
+    editor = ElementEditor(
+        event_manager, element_factory, modeling_language, diagrams, properties
+    )
+    package_item = create(PackageItem, UML.Package)
+    other_item = create(PackageItem, UML.Package)
+    other_item.subject.name = "other"
+
+    editor.open()
+    editor.editors.create_pages(package_item)
+    name_editor = find(editor.editors.vbox, "name-editor")
+
+    editor.editors.clear_pages()
+    editor.editors.create_pages(other_item)
+
+    assert find(editor.editors.vbox, "name-editor") is name_editor
+    assert find(editor.editors.vbox, "name-entry").get_text() == "other"
+
+
+def test_only_pool_rebindable_pages(
+    event_manager, element_factory, modeling_language, diagrams, create
+):
+    properties = DummyProperties()
+    editor = ElementEditor(
+        event_manager, element_factory, modeling_language, diagrams, properties
+    )
+    package_item = create(PackageItem, UML.Package)
+
+    editor.open()
+    editor.editors.create_pages(package_item)
+    editor.editors.clear_pages()
+
+    pool = editor.editors._page_pool  # noqa: SLF001
+    assert pool
+    assert all(supports_rebind(adapter) for adapter, _page in pool.values())
+    assert all(adapter.subject is None for adapter, _page in pool.values())
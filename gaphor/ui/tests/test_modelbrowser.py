@@ -1,4 +1,5 @@
 import pytest
+from gi.repository import GLib
 
 from gaphor import UML
 from gaphor.core.modeling import Diagram, ModelReady
@@ -135,6 +136,64 @@ def test_element_name_changed(model_browser, element_factory):
     assert style.as_int().value == 0
 
 
+def test_element_renamed_is_resorted(model_browser, element_factory):
+    class_a = element_factory.create(UML.Class)
+    class_a.name = "a"
+    class_b = element_factory.create(UML.Class)
+    class_b.name = "b"
+    while GLib.MainContext.default().iteration(False):
+        pass
+
+    class_b.name = "0"
+    while GLib.MainContext.default().iteration(False):
+        pass
+
+    assert model_browser.selection.get_item(0).get_item().element is class_b
+    assert model_browser.selection.get_item(1).get_item().element is class_a
+
+
+def test_element_renamed_with_branch_is_resorted(model_browser, element_factory):
+    package_a = element_factory.create(UML.Package)
+    package_a.name = "a"
+    package_b = element_factory.create(UML.Package)
+    package_b.name = "b"
+    class_ = element_factory.create(UML.Class)
+    class_.package = package_b
+    model_browser.select_element(class_)
+    while GLib.MainContext.default().iteration(False):
+        pass
+
+    package_b.name = "0"
+    while GLib.MainContext.default().iteration(False):
+        pass
+
+    assert model_browser.selection.get_item(0).get_item().element is package_b
+    assert model_browser.selection.get_item(1).get_item().element is class_
+
+
+def test_element_renamed_keeps_nested_branches_expanded(model_browser, element_factory):
+    package_a = element_factory.create(UML.Package)
+    package_a.name = "a"
+    package_b = element_factory.create(UML.Package)
+    package_b.name = "b"
+    nested_package = element_factory.create(UML.Package)
+    nested_package.name = "nested"
+    nested_package.package = package_b
+    class_ = element_factory.create(UML.Class)
+    class_.package = nested_package
+    model_browser.select_element(class_)
+    while GLib.MainContext.default().iteration(False):
+        pass
+
+    package_b.name = "0"
+    while GLib.MainContext.default().iteration(False):
+        pass
+
+    assert [
+        model_browser.selection.get_item(n).get_item().element for n in range(4)
+    ] == [package_b, nested_package, class_, package_a]
+
+
 def test_element_weight_changed(model_browser, element_factory):
     diagram = element_factory.create(Diagram)
     tree_item = model_browser.model.tree_item_for_element(diagram)
@@ -227,7 +286,7 @@ def test_search_next(model_browser, element_factory):
     class_b = element_factory.create(UML.Class)
     class_b.name = "b"
 
-    search_engine = SearchEngine(model_browser.model, model_browser.tree_view)
+    search_engine = SearchEngine(model_browser.search_index, model_browser.tree_view)
     model_browser.select_element(class_a)
     assert model_browser.get_selected_element() is class_a
 
@@ -242,7 +301,7 @@ def test_search_text_changed(model_browser, element_factory):
     class_b = element_factory.create(UML.Class)
     class_b.name = "b"
 
-    search_engine = SearchEngine(model_browser.model, model_browser.tree_view)
+    search_engine = SearchEngine(model_browser.search_index, model_browser.tree_view)
     model_browser.select_element(class_a)
     assert model_browser.get_selected_element() is class_a
 
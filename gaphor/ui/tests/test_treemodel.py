@@ -270,3 +270,84 @@ def test_element_with_member_and_no_owner(element_factory):
     association_model = tree_model.branches.get(association_item)
 
     assert property_item in association_model.elements
+
+
+def test_branch_tree_item_for_element(element_factory):
+    branch = Branch()
+    element = element_factory.create(UML.Class)
+    relationship = element_factory.create(UML.Association)
+
+    branch.append(element)
+    branch.append(relationship)
+
+    assert branch.tree_item_for_element(element) is branch.elements[1]
+    assert branch.tree_item_for_element(relationship) is branch.relationships[0]
+
+
+def test_branch_remove_element_from_index(element_factory):
+    branch = Branch()
+    element = element_factory.create(UML.Class)
+    branch.append(element)
+
+    branch.remove(element)
+
+    assert branch.tree_item_for_element(element) is None
+
+
+def test_tree_model_remove_branch_from_index(element_factory):
+    tree_model = TreeModel()
+    class_ = element_factory.create(UML.Class)
+    package = element_factory.create(UML.Package)
+    class_.package = package
+    tree_model.add_element(package)
+    tree_model.child_model(tree_model.tree_item_for_element(package))
+
+    tree_model.remove_element(class_)
+
+    assert tree_model.owner_branch_for_element(class_) is None
+
+
+def test_tree_model_clear_index(element_factory):
+    tree_model = TreeModel()
+    class_ = element_factory.create(UML.Class)
+    package = element_factory.create(UML.Package)
+    class_.package = package
+    tree_model.add_element(package)
+    tree_model.child_model(tree_model.tree_item_for_element(package))
+
+    tree_model.clear()
+
+    assert tree_model.tree_item_for_element(package) is None
+    assert tree_model.owner_branch_for_element(class_) is None
+
+
+def test_branch_extend(element_factory):
+    branch = Branch()
+    class_ = element_factory.create(UML.Class)
+    association = element_factory.create(UML.Association)
+    items_changed = ItemChangedHandler()
+    branch.elements.connect("items-changed", items_changed)
+
+    branch.extend([class_, association])
+
+    assert len(branch) == 2
+    assert isinstance(branch[0], RelationshipItem)
+    assert branch[1].element is class_
+    assert branch.relationships[0].element is association
+    assert items_changed.added == 2
+    assert len(items_changed.positions) == 2
+
+
+def test_tree_model_populate(element_factory):
+    tree_model = TreeModel()
+    class_ = element_factory.create(UML.Class)
+    package = element_factory.create(UML.Package)
+    nested_class = element_factory.create(UML.Class)
+    nested_class.package = package
+
+    tree_model.populate(element_factory.select())
+
+    assert len(tree_model.root) == 2
+    assert tree_model.tree_item_for_element(class_)
+    assert tree_model.tree_item_for_element(package)
+    assert len(tree_model.branches) == 1
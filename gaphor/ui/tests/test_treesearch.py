@@ -2,7 +2,7 @@ import pytest
 
 from gaphor import UML
 from gaphor.ui.treemodel import TreeModel
-from gaphor.ui.treesearch import search, sorted_tree_walker
+from gaphor.ui.treesearch import SearchIndex
 
 
 @pytest.fixture
@@ -23,60 +23,119 @@ def create(element_factory, tree_model):
     return _create
 
 
-def test_search(tree_model, create):
+@pytest.fixture
+def search_index(element_factory):
+    return SearchIndex(element_factory)
+
+
+def test_index_search(search_index, create):
     create("aaa")
     bbb = create("bbb")
 
-    found = search("b", sorted_tree_walker(tree_model))
+    found = search_index.search("b")
 
-    assert found.element is bbb
+    assert found is bbb
 
 
-def test_search_no_hit(tree_model, create):
+def test_index_search_no_hit(search_index, create):
     create("aaa")
     create("bbb")
 
-    found = search("z", sorted_tree_walker(tree_model))
+    found = search_index.search("z")
 
     assert found is None
 
 
-def test_search_with_child_models(tree_model, create):
+def test_index_search_nested_element(search_index, create):
     aaa = create("aaa")
+    create("ccc")
     bbb = create("bbb", parent=aaa)
 
-    found = search("b", sorted_tree_walker(tree_model))
+    assert search_index.order.index(bbb) == 1
+    assert search_index.search("b") is bbb
 
-    assert found.element is bbb
 
-
-def test_search_with_start_tree_item(tree_model, create):
+def test_index_search_with_start_element(search_index, create):
     create("aab")
     abb = create("abb")
     bbb = create("bbb")
 
-    found = search(
-        "b",
-        sorted_tree_walker(
-            tree_model, start_tree_item=tree_model.tree_item_for_element(abb)
-        ),
-    )
+    assert search_index.search("b", start_element=abb) is bbb
+    assert search_index.search("b", start_element=abb, from_current=True) is abb
+
 
-    assert found.element is bbb
+def test_index_search_wraps_around(search_index, create):
+    aab = create("aab")
+    create("abb")
+    bbb = create("bbb")
 
+    assert search_index.search("aa", start_element=bbb) is aab
 
-def test_search_from_current_with_start_tree_item(tree_model, create):
-    create("aab")
-    abb = create("abb")
-    create("bbb")
 
-    found = search(
-        "b",
-        sorted_tree_walker(
-            tree_model,
-            start_tree_item=tree_model.tree_item_for_element(abb),
-            from_current=True,
-        ),
-    )
+def test_index_add_element(search_index, element_factory, create):
+    create("aaa")
+    search_index.search("a")
+
+    bbb = create("bbb")
+    search_index.add(bbb)
+
+    assert search_index.search("b") is bbb
+
+
+def test_index_remove_element(search_index, create):
+    bbb = create("bbb")
+    search_index.search("b")
+
+    search_index.remove(bbb)
+
+    assert search_index.search("b") is None
+
+
+def test_index_rename_element(search_index, create):
+    aaa = create("aaa")
+    bbb = create("bbb")
+    search_index.search("a")
+
+    aaa.name = "ccc"
+    search_index.update(aaa)
+
+    assert search_index.search("a") is None
+    assert search_index.order == [bbb, aaa]
+
+
+def test_index_move_element_keeps_order(search_index, create):
+    aaa = create("aaa")
+    bbb = create("bbb")
+    ccc = create("ccc")
+    search_index.search("a")
+
+    bbb.name = "ddd"
+    search_index.update(bbb)
+
+    assert search_index.order == [aaa, ccc, bbb]
+
+
+def test_index_nested_elements_move_with_owner(search_index, create):
+    aaa = create("aaa")
+    bbb = create("bbb")
+    abc = create("abc", parent=aaa)
+    search_index.search("a")
+
+    aaa.name = "ccc"
+    search_index.update(aaa)
+
+    assert search_index.order == [bbb, aaa, abc]
+
+
+def test_index_update_label_of_dependant(search_index, element_factory, create):
+    klass = create("aaa")
+    attr = element_factory.create(UML.Property)
+    attr.name = "attr"
+    attr.type = klass
+    klass.ownedAttribute = attr
+    search_index.search("a")
+
+    klass.name = "bbb"
+    search_index.update(klass)
 
-    assert found.element is abb
+    assert search_index.search("attr: bbb") is attr
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from unicodedata import normalize
 
 from gi.repository import Gio, GObject, Pango
@@ -66,30 +67,58 @@ class RelationshipItem(TreeItem):
 
 
 class Branch:
-    def __init__(self):
+    def __init__(self, tree_item: TreeItem | None = None):
+        self.tree_item = tree_item
         self.elements = Gio.ListStore.new(TreeItem.__gtype__)
         self.relationships = Gio.ListStore.new(TreeItem.__gtype__)
+        self._tree_items: dict[Element, TreeItem] = {}
 
     def append(self, element: Element):
+        tree_item = TreeItem(element)
+        self._tree_items[element] = tree_item
         if isinstance(element, UML.Relationship):
             if self.relationships.get_n_items() == 0:
                 self.elements.insert(0, RelationshipItem(self.relationships))
-            self.relationships.append(TreeItem(element))
+            self.relationships.append(tree_item)
         else:
-            self.elements.append(TreeItem(element))
+            self.elements.append(tree_item)
+
+    def extend(self, elements: Iterable[Element]) -> None:
+        """Add multiple elements at once.
+
+        Items are added with a single splice per list store,
+        so ``items-changed`` is emitted only once.
+        """
+        new_elements = []
+        new_relationships = []
+        for element in elements:
+            tree_item = TreeItem(element)
+            self._tree_items[element] = tree_item
+            if isinstance(element, UML.Relationship):
+                new_relationships.append(tree_item)
+            else:
+                new_elements.append(tree_item)
+
+        if new_relationships:
+            if self.relationships.get_n_items() == 0:
+                self.elements.insert(0, RelationshipItem(self.relationships))
+            self.relationships.splice(
+                self.relationships.get_n_items(), 0, new_relationships
+            )
+        if new_elements:
+            self.elements.splice(self.elements.get_n_items(), 0, new_elements)
 
     def remove(self, element):
+        if not (tree_item := self._tree_items.pop(element, None)):
+            return
+
         list_store = (
             self.relationships
             if isinstance(element, UML.Relationship)
             else self.elements
         )
-        if (
-            index := next(
-                (i for i, ti in enumerate(list_store) if ti.element is element),
-                None,
-            )
-        ) is not None:
+        found, index = list_store.find(tree_item)
+        if found:
             list_store.remove(index)
 
         # Clean up empty relationships node
@@ -100,19 +129,21 @@ class Branch:
                     break
 
     def remove_all(self):
+        self._tree_items.clear()
         self.relationships.remove_all()
         self.elements.remove_all()
 
+    def tree_item_for_element(self, element: Element) -> TreeItem | None:
+        return self._tree_items.get(element)
+
     def changed(self, element: Element):
+        if not (tree_item := self._tree_items.get(element)):
+            return
         list_store = (
             self.relationships
             if isinstance(element, UML.Relationship)
             else self.elements
         )
-        if not (
-            tree_item := next((ti for ti in list_store if ti.element is element), None)
-        ):
-            return
         found, index = list_store.find(tree_item)
         if found:
             list_store.items_changed(index, 1, 1)
@@ -136,6 +167,23 @@ def visible(element):
     )
 
 
+def tree_owner(element: Element) -> Element | None:
+    """The element under which an element is shown in the tree."""
+    return element.owner or (
+        element.memberNamespace if isinstance(element, UML.NamedElement) else None
+    )
+
+
+def tree_depth(element: Element) -> int:
+    """The number of owners of an element in the tree."""
+    depth = 0
+    owner = tree_owner(element)
+    while owner:
+        depth += 1
+        owner = tree_owner(owner)
+    return depth
+
+
 def tree_item_sort(a, b, _user_data=None):
     if isinstance(a, RelationshipItem):
         return -1
@@ -150,14 +198,32 @@ class TreeModel:
     def __init__(self):
         super().__init__()
         self.branches: dict[TreeItem | None, Branch] = {None: Branch()}
+        self._branches_by_element: dict[Element, Branch] = {}
 
     @property
     def root(self) -> Gio.ListStore:
         return self.branches[None].elements
 
-    def sync(self, element):
+    def sync(self, element) -> bool:
+        """Update the tree item for an element.
+
+        Returns ``True`` if the text of the tree item changed,
+        and therefore its position in the (sorted) tree.
+        """
         if visible(element) and (tree_item := self.tree_item_for_element(element)):
+            text = tree_item.readonly_text
             tree_item.sync()
+            return tree_item.readonly_text != text  # type: ignore[no-any-return]
+        return False
+
+    def reposition(self, elements: Iterable[Element]) -> None:
+        """Notify a change for individual elements, so they can be resorted.
+
+        Tree list rows of elements with a branch of their own collapse.
+        """
+        for element in elements:
+            if owner_branch := self.owner_branch_for_element(element):
+                owner_branch.changed(element)
 
     def child_model(self, item: TreeItem, _user_data=None) -> Gio.ListStore:
         """This method will create branches on demand (lazy)."""
@@ -181,10 +247,10 @@ class TreeModel:
             if isinstance(item.element, UML.Namespace)
             else []
         ):
-            new_branch = Branch()
+            new_branch = Branch(item)
             self.branches[item] = new_branch
-            for e in owned_elements:
-                new_branch.append(e)
+            self._branches_by_element[item.element] = new_branch
+            new_branch.extend(owned_elements)
             return new_branch.elements
         return None
 
@@ -192,31 +258,30 @@ class TreeModel:
         self, element: Element, former_owner=_no_value
     ) -> Branch | None:
         if (
-            owner := (
-                element.owner
-                or (
-                    element.memberNamespace
-                    if isinstance(element, UML.NamedElement)
-                    else None
-                )
-            )
-            if former_owner is _no_value
-            else former_owner
+            owner := tree_owner(element) if former_owner is _no_value else former_owner
         ) is None:
             return self.branches[None]
 
-        return next(
-            (m for ti, m in self.branches.items() if ti and ti.element is owner),
-            None,
-        )
+        return self._branches_by_element.get(owner)
 
     def tree_item_for_element(self, element: Element | None) -> TreeItem | None:
         if element is None:
             return None
         if owner_branch := self.owner_branch_for_element(element):
-            return next((ti for ti in owner_branch if ti.element is element), None)
+            return owner_branch.tree_item_for_element(element)
         return None
 
+    def populate(self, elements: Iterable[Element]) -> None:
+        """(Re)populate the tree.
+
+        Only root elements are added, at once. Other branches are
+        populated lazily, once they're expanded.
+        """
+        self.clear()
+        self.branches[None].extend(
+            e for e in elements if visible(e) and tree_owner(e) is None
+        )
+
     def add_element(self, element: Element) -> None:
         if (not visible(element)) or self.tree_item_for_element(element):
             return
@@ -266,25 +331,20 @@ class TreeModel:
                 self.remove_branch(owner_branch)
 
     def remove_branch(self, branch: Branch) -> None:
-        tree_item = next(ti for ti, b in self.branches.items() if b is branch)
+        tree_item = branch.tree_item
         if tree_item is None:
             # Do never remove the root branch
             return
 
         del self.branches[tree_item]
+        if self._branches_by_element.get(tree_item.element) is branch:
+            del self._branches_by_element[tree_item.element]
 
         self.notify_child_model(tree_item.element)
 
     def notify_child_model(self, element):
         # Only notify the change, the branch is created in child_model()
-        owner_tree_item = self.tree_item_for_element(
-            element.owner
-            or (
-                element.memberNamespace
-                if isinstance(element, UML.NamedElement)
-                else None
-            )
-        )
+        owner_tree_item = self.tree_item_for_element(tree_owner(element))
         if (
             not self.branches.get(self.tree_item_for_element(element))
             and (owner_branch := self.branches.get(owner_tree_item)) is not None
@@ -296,6 +356,7 @@ class TreeModel:
         root.remove_all()
         self.branches.clear()
         self.branches[None] = root
+        self._branches_by_element.clear()
 
 
 def pango_attributes(element):
@@ -1,8 +1,15 @@
-import functools
+from __future__ import annotations
+
+from bisect import bisect_left, insort
 from typing import Iterable
 from unicodedata import normalize
 
-from gaphor.ui.treemodel import TreeItem, tree_item_sort
+from gaphor import UML
+from gaphor.core.format import format
+from gaphor.core.modeling import Element
+from gaphor.core.modeling.collection import collection
+from gaphor.i18n import gettext
+from gaphor.ui.treemodel import tree_owner, visible
 
 """
 Inputs:
@@ -21,47 +28,219 @@ Inputs:
 """
 
 
-def search(search_text, tree_walker: Iterable[TreeItem]):
-    search_text = normalize("NFC", search_text).casefold()
-
-    for tree_item in tree_walker:
-        text = normalize("NFC", tree_item.readonly_text).casefold()
-        if tree_item.element and search_text in text:
-            return tree_item
-
-
-def sorted_tree_walker(
-    model, start_tree_item=None, from_current=False
-) -> Iterable[TreeItem]:
-    """The tree model as one stream, sorted."""
-
-    def _flatten(list_store):
-        for tree_item in sorted_tree_items(list_store):
-            yield tree_item
-            if children := model.child_model(tree_item):
-                yield from _flatten(children)
-
-    iterator = _flatten(model.root)
-
-    if start_tree_item:
-        for tree_item in iterator:
-            if tree_item is start_tree_item:
-                if from_current:
-                    yield tree_item
-                break
-
-    yield from iterator
-
-    # Do not cache, to avoid stale data
-    if start_tree_item:
-        for tree_item in _flatten(model.root):
-            yield tree_item
-            if tree_item is start_tree_item:
-                break
-
-
-def sorted_tree_items(branch):
-    return sorted(
-        branch,
-        key=functools.cmp_to_key(tree_item_sort),
-    )
+def normalized_label(element: Element) -> str:
+    """The text of an element in the tree, normalized for sorting and searching."""
+    return normalize("NFC", format(element) or gettext("<None>")).casefold()
+
+
+def label_references(element: Element) -> set[Element]:
+    """Elements referenced by an element, e.g. the type of a property."""
+    references: set[Element] = set()
+
+    def save_func(_name, value):
+        if isinstance(value, Element):
+            references.add(value)
+        elif isinstance(value, collection):
+            references.update(value)
+
+    element.save(save_func)
+    return references
+
+
+class SearchIndex:
+    """Normalized labels of visible elements, in tree order.
+
+    The index is built on first use. It is kept up to date by
+    notifying it of created, deleted, renamed and moved elements.
+    Only the entries of affected elements are moved: the index is
+    not sorted again. Labels that show other elements, such as the
+    type of a property, are updated when those elements change.
+
+    It does not depend on the tree model, which creates its branches
+    lazily.
+    """
+
+    def __init__(self, element_factory):
+        self.element_factory = element_factory
+        self._built = False
+        self._labels: dict[Element, str] = {}
+        self._keys: dict[Element, tuple] = {}
+        self._entries: list[tuple[tuple, Element]] = []
+        self._owners: dict[Element, Element | None] = {}
+        self._children: dict[Element | None, set[Element]] = {}
+        self._references: dict[Element, set[Element]] = {}
+        self._dependants: dict[Element, set[Element]] = {}
+
+    def clear(self) -> None:
+        self._built = False
+        self._labels.clear()
+        self._keys.clear()
+        self._entries.clear()
+        self._owners.clear()
+        self._children.clear()
+        self._references.clear()
+        self._dependants.clear()
+
+    def add(self, element: Element) -> None:
+        if self._built and visible(element) and element not in self._labels:
+            self._index(element)
+            self._reposition({element})
+
+    def remove(self, element: Element) -> None:
+        if not (self._built and element in self._labels):
+            return
+        self._remove_entry(element)
+        del self._labels[element]
+        self._children.get(self._owners.pop(element), set()).discard(element)
+        self._set_references(element, set())
+        self._dependants.pop(element, None)
+        # Elements shown under the removed element are no longer visible
+        if children := self._children.pop(element, None):
+            self._reposition(children)
+
+    def update(self, element: Element) -> None:
+        """Update the label of an element, e.g. after it was renamed.
+
+        Labels of elements that show this element are updated as well.
+        """
+        if not self._built:
+            return
+        changed = set()
+        for e in {element, *self._dependants.get(element, ())}:
+            if e in self._labels and (label := normalized_label(e)) != self._labels[e]:
+                self._labels[e] = label
+                changed.add(e)
+        if element in self._labels:
+            self._set_references(element, self._label_references(element))
+        if changed:
+            self._reposition(changed)
+
+    def owner_changed(self, element: Element) -> None:
+        if not (self._built and element in self._labels):
+            return
+        owner = tree_owner(element)
+        if (old_owner := self._owners.get(element)) is not owner:
+            self._children.get(old_owner, set()).discard(element)
+            self._owners[element] = owner
+            self._children.setdefault(owner, set()).add(element)
+        self._reposition({element})
+
+    @property
+    def labels(self) -> dict[Element, str]:
+        self._build()
+        return self._labels
+
+    @property
+    def order(self) -> list[Element]:
+        self._build()
+        return [e for _k, e in self._entries]
+
+    def _build(self) -> None:
+        if self._built:
+            return
+        self._built = True
+        for element in self.element_factory.select(visible):
+            self._index(element)
+        affected = set(self._labels)
+        keys: dict[Element, tuple | None] = {}
+        self._keys = {
+            e: k
+            for e in self._labels
+            if (k := self._key(e, affected, keys)) is not None
+        }
+        self._entries = sorted((k, e) for e, k in self._keys.items())
+
+    def _index(self, element: Element) -> None:
+        self._labels[element] = normalized_label(element)
+        owner = self._owners[element] = tree_owner(element)
+        self._children.setdefault(owner, set()).add(element)
+        self._set_references(element, self._label_references(element))
+
+    def _label_references(self, element: Element) -> set[Element]:
+        # Only labels that are not just the element name can show other elements
+        name = normalize("NFC", getattr(element, "name", None) or "").casefold()
+        return set() if self._labels[element] == name else label_references(element)
+
+    def _set_references(self, element: Element, references: set[Element]) -> None:
+        old_references = self._references.pop(element, set())
+        for ref in old_references - references:
+            if dependants := self._dependants.get(ref):
+                dependants.discard(element)
+                if not dependants:
+                    del self._dependants[ref]
+        for ref in references - old_references:
+            self._dependants.setdefault(ref, set()).add(element)
+        if references:
+            self._references[element] = references
+
+    def _remove_entry(self, element: Element) -> None:
+        if (key := self._keys.pop(element, None)) is not None:
+            del self._entries[bisect_left(self._entries, (key,))]
+
+    def _reposition(self, elements: Iterable[Element]) -> None:
+        """Move the entries of elements, and the elements shown under them,
+        to their place in tree order."""
+        affected: set[Element] = set()
+        stack = list(elements)
+        while stack:
+            element = stack.pop()
+            if element not in affected:
+                affected.add(element)
+                stack.extend(self._children.get(element, ()))
+
+        for element in affected:
+            self._remove_entry(element)
+
+        keys: dict[Element, tuple | None] = {}
+        for element in affected:
+            if element in self._labels and (key := self._key(element, affected, keys)):
+                self._keys[element] = key
+                insort(self._entries, (key, element))
+
+    def _key(
+        self,
+        element: Element,
+        affected: set[Element],
+        keys: dict[Element, tuple | None],
+    ) -> tuple | None:
+        if element in keys:
+            return keys[element]
+        if element not in affected and element in self._keys:
+            return self._keys[element]
+        # Guard against ownership cycles
+        keys[element] = None
+        owner = tree_owner(element)
+        owner_key = () if owner is None else self._key(owner, affected, keys)
+        if owner_key is not None and element in self._labels:
+            node = (1, self._labels[element], element.id)
+            keys[element] = owner_key + (
+                ((0, "", ""), node)
+                if isinstance(element, UML.Relationship)
+                else (node,)
+            )
+        return keys[element]
+
+    def search(
+        self, search_text: str, start_element: Element | None = None, from_current=False
+    ) -> Element | None:
+        """Find the first element, in tree order, that matches the search text.
+
+        The search starts at ``start_element`` and wraps around.
+        """
+        search_text = normalize("NFC", search_text).casefold()
+        self._build()
+        labels = self._labels
+        entries = self._entries
+        size = len(entries)
+
+        if start_element and (key := self._keys.get(start_element)) is not None:
+            start = bisect_left(entries, (key,))
+            first = start if from_current else start + 1
+        else:
+            first = 0
+
+        for n in range(first, first + size):
+            _key, element = entries[n % size]
+            if search_text in labels[element]:
+                return element
+        return None
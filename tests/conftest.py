@@ -3,6 +3,7 @@
 from hypothesis import settings
 
 from gaphor.conftest import (
+    benchmark,
     create,
     diagram,
     element_factory,
@@ -0,0 +1,90 @@
+"""Benchmarks for performance sensitive parts of Gaphor.
+
+Timings are recorded in the test report (``--junitxml``).
+Benchmarks are not part of the default test run. Run them with
+``pytest -m benchmark``.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from gaphor import UML
+from gaphor.codegen import coder
+from gaphor.core.modeling import Diagram
+from gaphor.diagram.copypaste import copy_full, paste_full
+from gaphor.diagram.export import save_pdf, save_png, save_svg
+from gaphor.storage import storage
+from gaphor.UML.classes import ClassItem
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture
+def all_elements(element_factory, modeling_language, test_models):
+    with open(test_models / "all-elements.gaphor", encoding="utf-8") as f:
+        storage.load(f, element_factory, modeling_language)
+    return element_factory
+
+
+@pytest.mark.parametrize(
+    "save,magic", [(save_svg, b"<svg"), (save_pdf, b"%PDF"), (save_png, b"PNG")]
+)
+def test_benchmark_export(all_elements, benchmark, tmp_path, save, magic):
+    diagrams = list(all_elements.select(Diagram))
+
+    def export():
+        for diagram in diagrams:
+            save(tmp_path / f"{diagram.id}.out", diagram)
+
+    benchmark(export)
+
+    assert len(list(tmp_path.iterdir())) == len(diagrams)
+    assert all(magic in f.read_bytes()[:1024] for f in tmp_path.iterdir())
+
+
+def test_benchmark_generate_models(benchmark, tmp_path):
+    def generate():
+        for name, generated_model in coder.GENERATED_MODELS.items():
+            coder.main(
+                modelfile=generated_model.modelfile,
+                supermodelfiles=[
+                    (s, coder.GENERATED_MODELS[s].modelfile)
+                    for s in generated_model.supermodels
+                ],
+                overridesfile=generated_model.overridesfile,
+                outfile=tmp_path / f"{name}.py",
+            )
+
+    benchmark(generate, rounds=1)
+
+    for name, generated_model in coder.GENERATED_MODELS.items():
+        assert (tmp_path / f"{name}.py").read_text(encoding="utf-8") == Path(
+            generated_model.outfile
+        ).read_text(encoding="utf-8")
+
+
+def test_benchmark_paste_large_diagram(element_factory, diagram, create, benchmark):
+    for n in range(2000):
+        item = create(ClassItem, UML.Class)
+        item.subject.name = f"Class{n}"
+        item.subject.ownedAttribute = element_factory.create(UML.Property)
+        item.matrix.translate(n % 50 * 200, n // 50 * 100)
+
+    copy_data = copy_full(diagram.ownedPresentation, element_factory.lookup)
+
+    def paste():
+        new_diagram = element_factory.create(Diagram)
+        paste_full(copy_data, new_diagram)
+        return new_diagram
+
+    new_diagram = benchmark(paste, rounds=1)
+
+    pasted_items = list(new_diagram.select(ClassItem))
+    original_subjects = {item.subject for item in diagram.select(ClassItem)}
+    assert len(pasted_items) == 2000
+    assert {item.subject.name for item in pasted_items} == {
+        f"Class{n}" for n in range(2000)
+    }
+    assert not original_subjects & {item.subject for item in pasted_items}
+    assert all(len(item.subject.ownedAttribute) == 1 for item in pasted_items)
@@ -16,6 +16,7 @@ def test_help_output(capsys):
     assert "--dir directory" in captured.out
     assert "--format format" in captured.out
     assert "--regex regex" in captured.out
+    assert "--force" in captured.out
 
 
 @pytest.fixture
@@ -48,3 +49,34 @@ def test_export_svg(tmp_path, model):
 
     assert model_path.exists()
     assert (model_path / "main.svg").exists()
+
+
+def test_export_multiple_formats(tmp_path, model):
+    main(
+        ["gaphor", "export", "-f", "svg", "-f", "pdf", "-o", str(tmp_path), str(model)]
+    )
+
+    model_path = tmp_path / "New model"
+
+    assert (model_path / "main.svg").exists()
+    assert (model_path / "main.pdf").exists()
+
+
+def test_export_skips_unchanged_diagrams(tmp_path, model):
+    main(["gaphor", "export", "-f", "svg", "-o", str(tmp_path), str(model)])
+    outfile = tmp_path / "New model" / "main.svg"
+    outfile.write_text("unchanged", encoding="utf-8")
+
+    main(["gaphor", "export", "-f", "svg", "-o", str(tmp_path), str(model)])
+
+    assert outfile.read_text(encoding="utf-8") == "unchanged"
+
+
+def test_export_force(tmp_path, model):
+    main(["gaphor", "export", "-f", "svg", "-o", str(tmp_path), str(model)])
+    outfile = tmp_path / "New model" / "main.svg"
+    outfile.write_text("unchanged", encoding="utf-8")
+
+    main(["gaphor", "export", "--force", "-f", "svg", "-o", str(tmp_path), str(model)])
+
+    assert "<svg" in outfile.read_text(encoding="utf-8")
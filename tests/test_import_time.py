@@ -0,0 +1,58 @@
+"""Keep the start up time of Gaphor in check.
+
+Modules are imported in a fresh interpreter, with ``python -X importtime``.
+The import time budget is checked with the benchmarks (``pytest -m benchmark``).
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time budget, in microseconds
+IMPORT_TIME_BUDGET = 1_000_000
+
+
+def import_times(code):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_command_line_parsers_do_not_import_modeling_languages():
+    times = import_times(
+        "import gaphor.main; gaphor.main.initialize('gaphor.argparsers')"
+    )
+
+    assert "gaphor.UML" not in times
+    assert "gaphor.SysML" not in times
+    assert "gaphor.diagram.export" not in times
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("module", ["gaphor.main", "gaphor.application"])
+def test_import_time_budget(module):
+    times = import_times(f"import {module}")
+
+    assert times[module] < IMPORT_TIME_BUDGET
+
+
+def test_modeling_languages_are_loaded_on_demand():
+    times = import_times(
+        "from gaphor.services.modelinglanguage import ModelingLanguageService;"
+        "ModelingLanguageService().lookup_element('Class')"
+    )
+
+    assert "gaphor.UML" in times
+    assert "gaphor.SysML" not in times
+    assert "gaphor.RAAML" not in times
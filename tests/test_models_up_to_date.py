@@ -97,3 +97,25 @@ def test_raaml_model(tmp_path):
     generated_model = outfile.read_text(encoding="utf-8")
 
     assert generated_model == current_model
+
+
+def test_generate_all(tmp_path, monkeypatch):
+    current_models = {
+        name: Path(generated_model.outfile)
+        for name, generated_model in coder.GENERATED_MODELS.items()
+    }
+    monkeypatch.setattr(
+        coder,
+        "GENERATED_MODELS",
+        {
+            name: generated_model._replace(outfile=str(tmp_path / f"{name}.py"))
+            for name, generated_model in coder.GENERATED_MODELS.items()
+        },
+    )
+
+    coder.generate_all(jobs=2)
+
+    for name, current_model in current_models.items():
+        generated_model = (tmp_path / f"{name}.py").read_text(encoding="utf-8")
+
+        assert generated_model == current_model.read_text(encoding="utf-8")
@@ -0,0 +1,35 @@
+import importlib
+
+import pytest
+
+from gaphor.main import main
+
+
+def test_help_output(capsys):
+    with pytest.raises(SystemExit, match="0"):
+        main(["gaphor", "xmi-export", "--help"])
+
+    captured = capsys.readouterr()
+    assert "--dir directory" in captured.out
+    assert "--jobs jobs" in captured.out
+
+
+@pytest.fixture
+def models():
+    test_models = importlib.resources.files("test-models")
+    return [test_models / "all-elements.gaphor", test_models / "test-model.gaphor"]
+
+
+def test_export_xmi(tmp_path, models):
+    main(["gaphor", "xmi-export", "-o", str(tmp_path), str(models[0])])
+
+    content = (tmp_path / "all-elements.xmi").read_text(encoding="utf-8")
+
+    assert content.startswith("<XMI")
+
+
+def test_export_multiple_models(tmp_path, models):
+    main(["gaphor", "xmi-export", "-o", str(tmp_path), *map(str, models)])
+
+    assert (tmp_path / "all-elements.xmi").exists()
+    assert (tmp_path / "test-model.xmi").exists()